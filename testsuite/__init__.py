@@ -1,8 +1,19 @@
 """Monkeypatching land"""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from openshift_client import context
 
-# Default to kubectl instead of oc binary
-context.default_oc_path = os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_OC_PATH", "kubectl")
+# Default to kubectl instead of oc binary, openshift_client keeps the default per thread, see thread_pool()
+OC_PATH = os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_OC_PATH", "kubectl")
+context.default_oc_path = OC_PATH
+
+
+def _init_thread():
+    context.default_oc_path = OC_PATH
+
+
+def thread_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Returns thread pool whose threads run the same oc binary as the main thread"""
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=_init_thread)
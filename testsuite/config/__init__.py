@@ -51,6 +51,8 @@ settings = Dynaconf(
             must_exist=True,
             messages={"condition": "{value} is not valid exposer"},
         ),
+        Validator("kubernetes.transport", must_exist=True, is_in=["oc", "api"]),
+        Validator("kubernetes.modify", must_exist=True, is_in=["patch", "apply"]),
         Validator("control_plane.provider_secret", must_exist=True, ne=None),
         (
             Validator("control_plane.issuer.name", must_exist=True, ne=None)
@@ -18,7 +18,7 @@ def load(obj, env=None, silent=True, key=None, filename=None):
     control_plane = obj.setdefault("control_plane", {})
 
     cluster = control_plane.setdefault("cluster", {})
-    client = KubernetesClient(
+    client = KubernetesClient.interned(
         cluster.get("project"), cluster.get("api_url"), cluster.get("token"), cluster.get("kubeconfig_path")
     )
     obj["control_plane"]["cluster"] = client
@@ -32,7 +32,7 @@ def load(obj, env=None, silent=True, key=None, filename=None):
     clusters = control_plane.setdefault("additional_clusters", [])
     for value in clusters:
         clients.append(
-            KubernetesClient(
+            KubernetesClient.interned(
                 value.get("project"), value.get("api_url"), value.get("token"), value.get("kubeconfig_path")
             )
         )
@@ -40,11 +40,11 @@ def load(obj, env=None, silent=True, key=None, filename=None):
         control_plane["additional_clusters"] = clients
 
     if cluster2 := control_plane.setdefault("cluster2", {}):
-        obj["control_plane"]["cluster2"] = KubernetesClient(
+        obj["control_plane"]["cluster2"] = KubernetesClient.interned(
             cluster2.get("project"), cluster2.get("api_url"), cluster2.get("token"), cluster2.get("kubeconfig_path")
         )
 
     if cluster3 := control_plane.setdefault("cluster3", {}):
-        obj["control_plane"]["cluster3"] = KubernetesClient(
+        obj["control_plane"]["cluster3"] = KubernetesClient.interned(
             cluster3.get("project"), cluster3.get("api_url"), cluster3.get("token"), cluster3.get("kubeconfig_path")
         )
@@ -1,5 +1,6 @@
 """General exposers, not tied to Envoy or Gateway API"""
 
+from testsuite.config import settings
 from testsuite.gateway import Exposer, Gateway, Hostname
 from testsuite.httpx import KuadrantClient, ForceSNIClient
 from testsuite.kubernetes.openshift.route import OpenshiftRoute
@@ -49,6 +50,7 @@ class StaticLocalHostname(Hostname):
         self.force_https = force_https
 
     def client(self, **kwargs) -> KuadrantClient:
+        kwargs.setdefault("shared_transport", settings["httpx"]["shared_transport"])
         headers = kwargs.setdefault("headers", {})
         headers["Host"] = self.hostname
         ip = self.ip_getter()
@@ -1,5 +1,6 @@
 """Module containing all gateway classes"""
 
+from functools import cached_property
 from time import sleep
 from typing import Any
 
@@ -12,6 +13,8 @@ from testsuite.kubernetes.client import KubernetesClient
 from testsuite.kubernetes import KubernetesObject, modify
 from testsuite.kuadrant.policy import Policy
 from testsuite.kubernetes.deployment import Deployment
+from testsuite.kubernetes.informer import INFORMER
+from testsuite.kubernetes.secret import Secret
 from testsuite.utils import check_condition, asdict, domain_match
 
 
@@ -80,9 +83,9 @@ class KuadrantGateway(KubernetesObject, Gateway):
         with self.context:
             return f"{self.refresh().model.status.addresses[0].value}:80"
 
-    @property
+    @cached_property
     def cluster(self):
-        """Hostname of the first listener"""
+        """KubernetesClient for the cluster and namespace of this Gateway, created only once"""
         return KubernetesClient.from_context(self.context)
 
     def is_ready(self):
@@ -96,6 +99,7 @@ class KuadrantGateway(KubernetesObject, Gateway):
         """Waits for the gateway to be ready in the sense of is_ready(self)"""
         success = self.wait_until(lambda obj: self.__class__(obj.model).is_ready(), timelimit=timeout)
         assert success, f"Gateway didn't reach required state, instead it was: {self.model.status.conditions}"
+        self.record_reconcile("Programmed")
         if settings["control_plane"]["slow_loadbalancers"]:
             sleep(60)
 
@@ -150,12 +154,13 @@ class KuadrantGateway(KubernetesObject, Gateway):
 
     def delete(self, ignore_not_found=True, cmd_args=None):
         res = super().delete(ignore_not_found, cmd_args)
-        with self.cluster.context:
-            # TLSPolicy does not delete certificates it creates
-            for secret in oc.selector("secret").objects():
-                if "tls" in secret.name() and self.name() in secret.name():
-                    secret.delete()
+        # TLSPolicy does not delete certificates it creates
+        for secret in INFORMER.list(
+            self.cluster.context, "v1", "Secret", name_contains=("tls", self.name()), fresh=True
+        ):
+            Secret(secret, context=self.cluster.context).delete()
 
+        with self.cluster.context:
             # Istio does not delete ServiceAccount
             oc.selector(f"sa/{self.service_name}").delete(ignore_not_found=True)
         return res
@@ -26,6 +26,7 @@ class StaticHostname(Hostname):
         self.tls_cert_getter = tls_cert_getter
 
     def client(self, **kwargs) -> KuadrantClient:
+        kwargs.setdefault("shared_transport", settings["httpx"]["shared_transport"])
         protocol = "http"
         if self.tls_cert_getter is not None:
             cert = self.tls_cert_getter(self.hostname)
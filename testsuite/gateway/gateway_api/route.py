@@ -136,3 +136,4 @@ class HTTPRoute(KubernetesObject, GatewayRoute):
 
         success = self.wait_until(_ready, timelimit=10)
         assert success, f"{self.kind()} did not get ready in time"
+        self.record_reconcile("Ready")
@@ -1,7 +1,13 @@
 """Common classes for Httpx"""
 
 import ssl
+import threading
+import time
 import typing
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
 
 # I change return type of HTTPX client to Kuadrant Result
 # mypy: disable-error-code="override, return-value"
@@ -9,7 +15,7 @@ from tempfile import NamedTemporaryFile
 from typing import Union, Iterable, MutableMapping
 
 import backoff
-from httpx import Client, RequestError, USE_CLIENT_DEFAULT, Request
+from httpx import Client, RequestError, USE_CLIENT_DEFAULT, Request, HTTPTransport, create_ssl_context
 from httpx._client import UseClientDefault
 from httpx._types import (
     URLTypes,
@@ -23,6 +29,8 @@ from httpx._types import (
 )
 
 from testsuite.certificates import Certificate
+from testsuite.httpx.histogram import LatencyHistogram
+from testsuite.httpx.streaming import StreamedBody
 
 
 def create_tmp_file(content: str):
@@ -35,23 +43,192 @@ def create_tmp_file(content: str):
     return file
 
 
-class Result:
+class SharedTransport(HTTPTransport):
+    """HTTPTransport shared by multiple clients, closing a client does not close its connection pool"""
+
+    def close(self) -> None:
+        pass
+
+    def __exit__(self, *args, **kwargs) -> None:
+        pass
+
+    def close_shared(self):
+        """Closes the connection pool"""
+        super().close()
+
+
+class TransportCache:
+    """
+    Process-wide cache of SSLContexts and keep-alive connection pools shared by KuadrantClients.
+    SSLContexts are keyed by the verify and client Certificates, connection pools by the SSLContext and base URL.
+    """
+
+    def __init__(self):
+        self._contexts: dict[tuple, ssl.SSLContext] = {}
+        self._transports: dict[tuple, SharedTransport] = {}
+        self._lock = threading.RLock()
+
+    def ssl_context(
+        self, verify: Union[Certificate, bool], cert: Certificate = None, http2: bool = False
+    ) -> ssl.SSLContext:
+        """
+        Returns SSLContext trusting `verify` (or system CAs) and presenting the `cert` client certificate.
+        HTTP/2 clients get their own SSLContexts, because httpcore sets ALPN protocols on the context before connecting.
+        """
+        key = (verify, cert, http2)
+        with self._lock:
+            if key not in self._contexts:
+                if isinstance(verify, Certificate):
+                    context = ssl.create_default_context(cadata=verify.chain)
+                else:
+                    context = create_ssl_context(verify=verify)
+                if cert:
+                    # SSLContext can load client certificates only from files, they are not needed after loading
+                    with create_tmp_file(cert.chain) as cert_file, create_tmp_file(cert.key) as key_file:
+                        context.load_cert_chain(cert_file.name, key_file.name)
+                self._contexts[key] = context
+            return self._contexts[key]
+
+    def resolve_verify(self, verify, cert: Certificate = None, http2: bool = False):
+        """
+        Returns cached SSLContext for Certificate or bool `verify`, other values (e.g. own SSLContext) are returned
+        as they are. Client certificate can't be added to them, so ValueError is raised instead of ignoring it.
+        """
+        if verify is None:
+            verify = True
+        if isinstance(verify, (Certificate, bool)):
+            return self.ssl_context(verify, cert, http2)
+        if cert is not None:
+            raise ValueError(f"Client certificate can't be used with verify={verify!r}, load it into the SSLContext")
+        return verify
+
+    def transport(self, key: tuple, context: ssl.SSLContext, http1: bool = True, http2: bool = False):
+        """Returns connection pool shared by all clients with the same key, SSLContext and HTTP versions"""
+        key = (key, context, http1, http2)
+        with self._lock:
+            if key not in self._transports:
+                self._transports[key] = SharedTransport(verify=context, http1=http1, http2=http2)
+            return self._transports[key]
+
+    def close(self):
+        """Closes all shared connection pools"""
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+        for transport in transports:
+            transport.close_shared()
+
+
+TRANSPORT_CACHE = TransportCache()
+
+
+class RequestPacer:
+    """Thread-safe pacer which spaces out requests so that they are sent at most at the target rate"""
+
+    def __init__(self, rps: float = None):
+        self.interval = 1 / rps if rps else 0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserves the next send slot and returns how many seconds remain until it"""
+        if not self.interval:
+            return 0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        return slot - now
+
+    def wait(self):
+        """Blocks until the next send slot is available"""
+        if (delay := self.reserve()) > 0:
+            time.sleep(delay)
+
+
+@dataclass
+class RequestTimings:
+    """Durations (in seconds) of individual phases of a single HTTP request, None if the phase did not happen"""
+
+    PHASES = ("connect", "tls", "first_byte", "total")
+
+    connect: float | None = None
+    tls: float | None = None
+    first_byte: float | None = None
+    total: float | None = None
+
+    def tracer(self, trace=None, asynchronous: bool = False):
+        """
+        Returns httpcore trace callback which records the timings into this object.
+        Reused keep-alive connections do not report connect and tls phases.
+        :param trace: Already existing trace callback which will be called as well
+        :param asynchronous: Return coroutine callback, which is required by async clients
+        """
+        start = time.perf_counter()
+        started: dict[str, float] = {}
+
+        def _record(event_name: str):
+            now = time.perf_counter()
+            if event_name.endswith(".started"):
+                started[event_name.removesuffix(".started")] = now
+            elif event_name == "connection.connect_tcp.complete":
+                self.connect = now - started.get("connection.connect_tcp", start)
+            elif event_name == "connection.start_tls.complete":
+                self.tls = now - started.get("connection.start_tls", start)
+            elif event_name.endswith(".receive_response_headers.complete") and self.first_byte is None:
+                self.first_byte = now - start
+
+        if asynchronous:
+
+            async def _atrace(event_name: str, info):
+                _record(event_name)
+                if trace is not None:
+                    await trace(event_name, info)
+
+            return _atrace
+
+        def _trace(event_name: str, info):
+            _record(event_name)
+            if trace is not None:
+                trace(event_name, info)
+
+        return _trace
+
+
+class Result:  # pylint: disable=too-many-instance-attributes
     """Result from HTTP request"""
 
-    def __init__(self, retry_codes, response=None, error=None):
+    def __init__(
+        self, retry_codes, response=None, error=None, timings: RequestTimings = None, body: StreamedBody = None
+    ):
         self.response = response
         self.error = error
+        # Set for streamed requests instead of the response content, which is not kept in memory
+        self.body = body
         self.retry_codes = retry_codes
+        self.timings = timings or RequestTimings()
+        # Retry accounting of the logical request this Result is the final attempt of
+        self.attempts = 1
+        self.retries: list[str] = []
+        self.backoff_time = 0.0
+
+    def backoff_cause(self) -> str | None:
+        """Returns the reason why the Result is considered an instability and should be retried, None otherwise"""
+        if self.has_dns_error():
+            return "dns"
+        if self.error is None and self.status_code in self.retry_codes:
+            return f"status {self.status_code}"
+        if self.has_error("Server disconnected without sending a response."):
+            return "disconnected"
+        if self.has_error("timed out"):
+            return "timeout"
+        if self.has_error("SSL: UNEXPECTED_EOF_WHILE_READING"):
+            return "tls eof"
+        return None
 
     def should_backoff(self):
         """True, if the Result can be considered an instability and should be retried"""
-        return (
-            self.has_dns_error()
-            or (self.error is None and self.status_code in self.retry_codes)
-            or self.has_error("Server disconnected without sending a response.")
-            or self.has_error("timed out")
-            or self.has_error("SSL: UNEXPECTED_EOF_WHILE_READING")
-        )
+        return self.backoff_cause() is not None
 
     def has_error(self, error_msg: str) -> bool:
         """True, if the request failed and an error with message was returned"""
@@ -98,17 +275,198 @@ class Result:
         return f"Result[error={self.error}]"
 
 
+class RetryStats:
+    """Thread-safe counters of request attempts, retries by cause and time spent sleeping in backoff"""
+
+    def __init__(self):
+        self.requests = 0
+        self.attempts = 0
+        self.retries: Counter[str] = Counter()
+        self.backoff_time = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, result: Result):
+        """Adds retry accounting of a finished logical request"""
+        with self._lock:
+            self.requests += 1
+            self.attempts += result.attempts
+            self.retries.update(result.retries)
+            self.backoff_time += result.backoff_time
+
+    def asdict(self) -> dict:
+        """Returns JSON-serializable copy of the counters"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": dict(self.retries),
+                "backoff_time": self.backoff_time,
+            }
+
+    def __str__(self):
+        return (
+            f"RetryStats[requests={self.requests}, attempts={self.attempts}, retries={dict(self.retries)}, "
+            f"backoff_time={self.backoff_time:.1f}s]"
+        )
+
+
+# Retry accounting of all KuadrantClients in this process
+SESSION_RETRY_STATS = RetryStats()
+
+# Retries of the logical request currently being retried, backoff handlers run in the requesting thread/task
+_pending_retries: ContextVar[list | None] = ContextVar("pending_retries", default=None)
+
+
+def _on_backoff(details):
+    """Remembers cause and planned sleep of the failed attempt"""
+    if (pending := _pending_retries.get()) is None:
+        pending = []
+        _pending_retries.set(pending)
+    pending.append((details["value"].backoff_cause(), details["wait"]))
+
+
+def _on_finished(details):
+    """Attaches retry accounting to the final Result and records it to the client and session counters"""
+    result = details["value"]
+    retries = _pending_retries.get() or []
+    _pending_retries.set(None)
+    result.attempts = details["tries"]
+    result.retries = [cause for cause, _ in retries]
+    result.backoff_time = sum(wait for _, wait in retries)
+    details["args"][0].retry_stats.record(result)
+    SESSION_RETRY_STATS.record(result)
+
+
+# Retries Results which should_backoff(), with retry accounting; works for both sync and async request methods
+retry_unstable = backoff.on_predicate(
+    backoff.fibo,
+    lambda result: result.should_backoff(),
+    max_tries=8,
+    jitter=None,
+    on_backoff=_on_backoff,
+    on_success=_on_finished,
+    on_giveup=_on_finished,
+)
+
+
 class ResultList(list):
     """List-like object for Result"""
 
     def assert_all(self, status_code):
         """Assert all responses that contain certain status code"""
-        for request in self:
+        for i, request in enumerate(self):
             assert request.status_code == status_code, (
-                f"Status code assertion failed for request {self.index(request)+1} out of {len(self)} requests: "
+                f"Status code assertion failed for request {i+1} out of {len(self)} requests: "
                 f"{request} != {status_code}"
             )
 
+    def latency(self, phase: str = "total") -> LatencyHistogram:
+        """Returns histogram of latencies of the given RequestTimings phase for all the results"""
+        histogram = LatencyHistogram()
+        for result in self:
+            if (value := getattr(result.timings, phase)) is not None:
+                histogram.record(value)
+        return histogram
+
+    def assert_latency(self, percentile: float, budget: float, phase: str = "total"):
+        """Assert that the percentile (0-100) of the latencies of the given phase is within budget (in seconds)"""
+        self.latency(phase).assert_percentile(percentile, budget)
+
+
+class ResultSummary:
+    """
+    Constant-memory alternative to ResultList for large amounts of requests.
+    Results are aggregated as they arrive into status code and error histograms and latency percentiles,
+    only the first `max_failures` failed requests are kept (without their response bodies).
+    """
+
+    def __init__(self, max_failures: int = 10):
+        self.max_failures = max_failures
+        self.total = 0
+        self.status_codes: Counter[int] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.latencies = {phase: LatencyHistogram() for phase in RequestTimings.PHASES}
+        self.failures: list[str] = []
+        # Index of the first result for every status code/error class, used for assertion messages
+        self._first_seen: dict[int | str, int] = {}
+
+    @staticmethod
+    def error_class(result: Result) -> str:
+        """Returns category of the error the result has failed with"""
+        if result.has_dns_error():
+            return "dns"
+        if result.has_tls_error():
+            return "tls"
+        if result.has_error("timed out"):
+            return "timeout"
+        return "other"
+
+    def append(self, result: Result):
+        """Aggregates the Result and drops it"""
+        index = self.total
+        self.total += 1
+        if result.error is not None:
+            key: int | str = self.error_class(result)
+            self.errors[key] += 1  # type: ignore[index]
+            self._add_failure(index, str(result))
+        else:
+            key = result.response.status_code
+            self.status_codes[key] += 1  # type: ignore[index]
+            for phase, histogram in self.latencies.items():
+                if (value := getattr(result.timings, phase)) is not None:
+                    histogram.record(value)
+            if key >= 500:  # type: ignore[operator]
+                # Streamed responses were not read into memory, only their length and digest are known
+                body = result.body if result.body is not None else result.response.text[:200]
+                self._add_failure(index, f"{result}: {body}")
+        self._first_seen.setdefault(key, index)
+
+    def extend(self, results: Iterable[Result]):
+        """Aggregates all the Results"""
+        for result in results:
+            self.append(result)
+
+    def _add_failure(self, index, description):
+        if len(self.failures) < self.max_failures:
+            self.failures.append(f"#{index+1}: {description}")
+
+    def __len__(self):
+        return self.total
+
+    def assert_all(self, status_code):
+        """Assert all responses that contain certain status code"""
+        mismatched = [key for key in self._first_seen if key != status_code]
+        if mismatched:
+            first = min(mismatched, key=self._first_seen.__getitem__)
+            raise AssertionError(
+                f"Status code assertion failed for request {self._first_seen[first]+1} out of {self.total} requests: "
+                f"{first} != {status_code}\n{self}"
+            )
+
+    def assert_count(self, status_code, count: int, tolerance: int = 0):
+        """Assert that number of responses with certain status code is within tolerance of expected count"""
+        actual = self.status_codes[status_code]
+        assert abs(actual - count) <= tolerance, f"Expected {count}±{tolerance} of {status_code}, got {actual}\n{self}"
+
+    def latency(self, phase: str = "total") -> LatencyHistogram:
+        """Returns histogram of latencies of the given RequestTimings phase"""
+        return self.latencies[phase]
+
+    def assert_latency(self, percentile: float, budget: float, phase: str = "total"):
+        """Assert that the percentile (0-100) of the latencies of the given phase is within budget (in seconds)"""
+        self.latency(phase).assert_percentile(percentile, budget)
+
+    def assert_no_errors(self):
+        """Assert that all requests received a response"""
+        assert not self.errors, f"{sum(self.errors.values())} requests failed\n{self}"
+
+    def __str__(self):
+        failures = "".join(f"\n  {failure}" for failure in self.failures)
+        return (
+            f"ResultSummary[total={self.total}, status_codes={dict(self.status_codes)}, "
+            f"errors={dict(self.errors)}, latency={self.latency()}]{failures}"
+        )
+
 
 class KuadrantClient(Client):
     """Httpx client which retries unstable requests"""
@@ -119,39 +477,44 @@ class KuadrantClient(Client):
         verify: Union[Certificate, bool] = True,
         cert: Certificate = None,
         retry_codes: Iterable[int] = None,
+        shared_transport: bool = False,
+        http1: bool = True,
+        http2: bool = False,
         **kwargs,
     ):
-        self.files = []
+        """
+        :param verify: CA Certificate to trust, True for system CAs or False to disable verification
+        :param cert: Client certificate
+        :param retry_codes: Status codes which are considered an instability and are retried
+        :param shared_transport: Reuse keep-alive connections with all other clients
+            with the same base URL and certificates, instead of opening new ones
+        :param http1: Allow HTTP/1.1. Disabling it with http2 enabled uses HTTP/2 with prior knowledge,
+            which is the only way to get HTTP/2 over plain-text (h2c) connections
+        :param http2: Negotiate HTTP/2 through ALPN, concurrent requests are then multiplexed
+            as streams over a single connection
+        """
         self.retry_codes = {503} if retry_codes is None else set(retry_codes)
-        _verify = None
-        if isinstance(verify, Certificate):
-            verify_file = create_tmp_file(verify.chain)
-            self.files.append(verify_file)
-            _verify = ssl.create_default_context(cafile=verify_file.name)
-        _cert = None
-        if cert:
-            cert_file = create_tmp_file(cert.chain)
-            self.files.append(cert_file)
-            key_file = create_tmp_file(cert.key)
-            self.files.append(key_file)
-            _cert = (cert_file.name, key_file.name)
-
-        # Mypy does not understand the typing magic I have done
-        self.verify = _verify or verify
-        super().__init__(verify=self.verify, cert=_cert or cert, **kwargs)  # type: ignore
+        self.retry_stats = RetryStats()
+        # Kept for clients derived from this one, which may need SSLContext for other HTTP versions
+        self.tls_verify, self.tls_cert = verify, cert
+        # SSLContexts are cached, so that CA and client certificates are loaded only once per session
+        self.verify = TRANSPORT_CACHE.resolve_verify(verify, cert, http2)
+        if shared_transport and isinstance(self.verify, ssl.SSLContext):
+            kwargs["transport"] = TRANSPORT_CACHE.transport(
+                self.connection_key(kwargs.get("base_url", "")), self.verify, http1, http2
+            )
+        super().__init__(verify=self.verify, http1=http1, http2=http2, **kwargs)  # type: ignore
 
-    def close(self) -> None:
-        super().close()
-        for file in self.files:
-            file.close()
-        self.files = []
+    def connection_key(self, base_url) -> tuple:
+        """Returns key which identifies connections this client can share with other clients"""
+        return (str(base_url),)
 
     def add_retry_code(self, code):
         """Add a new retry code to"""
         self.retry_codes.add(code)
 
     # pylint: disable=too-many-locals
-    @backoff.on_predicate(backoff.fibo, lambda result: result.should_backoff(), max_tries=8, jitter=None)
+    @retry_unstable
     def request(
         self,
         method: str,
@@ -169,6 +532,10 @@ class KuadrantClient(Client):
         timeout=None,
         extensions=None,
     ) -> Result:
+        timings = RequestTimings()
+        extensions = dict(extensions or {})
+        extensions["trace"] = timings.tracer(extensions.get("trace"))
+        start = time.perf_counter()
         try:
             response = super().request(
                 method,
@@ -185,20 +552,112 @@ class KuadrantClient(Client):
                 timeout=timeout,
                 extensions=extensions,
             )
-            return Result(self.retry_codes, response=response)
+            timings.total = time.perf_counter() - start
+            return Result(self.retry_codes, response=response, timings=timings)
         except RequestError as e:
-            return Result(self.retry_codes, error=e)
+            timings.total = time.perf_counter() - start
+            return Result(self.retry_codes, error=e, timings=timings)
 
     def get(self, *args, **kwargs) -> Result:
         return super().get(*args, **kwargs)
 
-    def get_many(self, url, count, *, params=None, headers=None, auth=None) -> ResultList:
-        """Send multiple `GET` requests."""
-        responses = ResultList()
-        for _ in range(count):
-            responses.append(self.get(url, params=params, headers=headers, auth=auth))
+    @retry_unstable
+    def stream_request(
+        self,
+        method: str,
+        url,
+        *,
+        hash_algorithm: str = "sha256",
+        chunk_size: int = None,
+        extensions=None,
+        **kwargs,
+    ) -> Result:
+        """
+        Sends request and reads the response body incrementally, keeping only its length and digest in Result.body,
+        so that large payloads or long token streams are never buffered in memory.
+        The response content itself is not available on the Result.
+        Request `content` can be a MappedFile or RepeatedContent to send large bodies without buffering them as well.
+        :param hash_algorithm: hashlib algorithm used for the body digest
+        :param chunk_size: Size of the chunks the body is read in, as they arrive by default
+        :param kwargs: Passed to the stream() call (content, json, headers, auth, ...)
+        """
+        timings = RequestTimings()
+        extensions = dict(extensions or {})
+        extensions["trace"] = timings.tracer(extensions.get("trace"))
+        start = time.perf_counter()
+        try:
+            body = StreamedBody(hash_algorithm)
+            with self.stream(method, url, extensions=extensions, **kwargs) as response:
+                for chunk in response.iter_bytes(chunk_size):
+                    body.update(chunk)
+            timings.total = time.perf_counter() - start
+            return Result(self.retry_codes, response=response, timings=timings, body=body)
+        except RequestError as e:
+            timings.total = time.perf_counter() - start
+            return Result(self.retry_codes, error=e, timings=timings)
 
-        return responses
+    def request_many(
+        self,
+        method: str,
+        url,
+        count: int,
+        *,
+        concurrency: int = 1,
+        rps: float = None,
+        results: ResultList | ResultSummary | None = None,
+        streaming: bool = False,
+        **kwargs,
+    ) -> ResultList | ResultSummary:
+        """
+        Send multiple requests, optionally concurrently, and return their Results in submission order.
+        :param concurrency: Maximum number of requests in flight at the same time,
+            values above the connection pool limits (`limits` client argument) will queue on the pool
+        :param rps: Target number of requests sent per second, unlimited if None
+        :param results: Container the Results are appended to as they arrive, e.g. ResultSummary for
+            constant-memory aggregation of large amounts of requests. New ResultList by default
+        :param streaming: Send the requests with stream_request(), keeping only length and digest of response bodies
+        :param kwargs: Passed to every request() call (content, json, headers, auth, ...)
+        """
+        results = ResultList() if results is None else results
+        pacer = RequestPacer(rps)
+        send = self.stream_request if streaming else self.request
+
+        def _send(_):
+            pacer.wait()
+            return send(method, url, **kwargs)
+
+        if concurrency <= 1:
+            results.extend(_send(i) for i in range(count))
+            return results
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results.extend(executor.map(_send, range(count)))
+        return results
+
+    def get_many(
+        self,
+        url,
+        count,
+        *,
+        params=None,
+        headers=None,
+        auth=None,
+        concurrency: int = 1,
+        rps: float = None,
+        results: ResultList | ResultSummary | None = None,
+    ) -> ResultList | ResultSummary:
+        """Send multiple `GET` requests."""
+        return self.request_many(
+            "GET",
+            url,
+            count,
+            params=params,
+            headers=headers,
+            auth=auth,
+            concurrency=concurrency,
+            rps=rps,
+            results=results,
+        )
 
 
 class ForceSNIClient(KuadrantClient):
@@ -213,8 +672,13 @@ class ForceSNIClient(KuadrantClient):
         sni_hostname: str = None,
         **kwargs,
     ):
-        super().__init__(verify=verify, cert=cert, retry_codes=retry_codes, **kwargs)
+        # Needs to be set before the transport is selected
         self.sni_hostname = sni_hostname
+        super().__init__(verify=verify, cert=cert, retry_codes=retry_codes, **kwargs)
+
+    def connection_key(self, base_url) -> tuple:
+        # Connections are pooled by the origin (IP), they can't be shared with clients using different SNI
+        return super().connection_key(base_url) + (self.sni_hostname,)
 
     def build_request(
         self,
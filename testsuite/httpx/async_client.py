@@ -0,0 +1,203 @@
+"""Asynchronous counterpart of KuadrantClient, for sending concurrent traffic to multiple hostnames at once"""
+
+# I change return type of HTTPX client to Kuadrant Result
+# mypy: disable-error-code="override, return-value"
+import asyncio
+import time
+from typing import Awaitable, Iterable, TypeVar, Union
+
+from httpx import AsyncClient, RequestError
+
+from testsuite.certificates import Certificate
+from testsuite.httpx import (
+    TRANSPORT_CACHE,
+    ForceSNIClient,
+    KuadrantClient,
+    RequestPacer,
+    RequestTimings,
+    Result,
+    ResultList,
+    ResultSummary,
+    RetryStats,
+    retry_unstable,
+)
+
+T = TypeVar("T")
+
+
+class AsyncKuadrantClient(AsyncClient):
+    """Async httpx client which retries unstable requests, with the same Result semantics as KuadrantClient"""
+
+    def __init__(
+        self,
+        *,
+        verify: Union[Certificate, bool] = True,
+        cert: Certificate = None,
+        retry_codes: Iterable[int] = None,
+        http1: bool = True,
+        http2: bool = False,
+        **kwargs,
+    ):
+        self.retry_codes = {503} if retry_codes is None else set(retry_codes)
+        self.retry_stats = RetryStats()
+        self.verify = TRANSPORT_CACHE.resolve_verify(verify, cert, http2)
+        super().__init__(verify=self.verify, http1=http1, http2=http2, **kwargs)  # type: ignore
+
+    @classmethod
+    def from_client(cls, client: KuadrantClient, **kwargs) -> "AsyncKuadrantClient":
+        """Creates async client with the same base URL, headers, TLS configuration and retry codes as `client`"""
+        kwargs.setdefault("base_url", client.base_url)
+        kwargs.setdefault("headers", client.headers)
+        kwargs.setdefault("timeout", client.timeout)
+        # SSLContext is taken from TRANSPORT_CACHE, as contexts of HTTP/2 clients have different ALPN protocols
+        if "verify" not in kwargs:
+            kwargs["verify"] = client.tls_verify
+            kwargs.setdefault("cert", client.tls_cert)
+        kwargs.setdefault("retry_codes", client.retry_codes)
+        if isinstance(client, ForceSNIClient):
+            return AsyncForceSNIClient(sni_hostname=client.sni_hostname, **kwargs)
+        return cls(**kwargs)
+
+    def add_retry_code(self, code):
+        """Add a new retry code to"""
+        self.retry_codes.add(code)
+
+    # pylint: disable=too-many-locals
+    @retry_unstable
+    async def request(
+        self,
+        method: str,
+        url,
+        *,
+        content=None,
+        data=None,
+        files=None,
+        json=None,
+        params=None,
+        headers=None,
+        cookies=None,
+        auth=None,
+        follow_redirects=None,
+        timeout=None,
+        extensions=None,
+    ) -> Result:
+        timings = RequestTimings()
+        extensions = dict(extensions or {})
+        extensions["trace"] = timings.tracer(extensions.get("trace"), asynchronous=True)
+        start = time.perf_counter()
+        try:
+            response = await super().request(
+                method,
+                url,
+                content=content,
+                data=data,
+                files=files,
+                json=json,
+                params=params,
+                headers=headers,
+                cookies=cookies,
+                auth=auth,
+                follow_redirects=follow_redirects,
+                timeout=timeout,
+                extensions=extensions,
+            )
+            timings.total = time.perf_counter() - start
+            return Result(self.retry_codes, response=response, timings=timings)
+        except RequestError as e:
+            timings.total = time.perf_counter() - start
+            return Result(self.retry_codes, error=e, timings=timings)
+
+    async def get(self, *args, **kwargs) -> Result:
+        return await super().get(*args, **kwargs)
+
+    async def request_many(
+        self,
+        method: str,
+        url,
+        count: int,
+        *,
+        concurrency: int = 1,
+        rps: float = None,
+        results: ResultList | ResultSummary | None = None,
+        **kwargs,
+    ) -> ResultList | ResultSummary:
+        """Async variant of KuadrantClient.request_many(), concurrency is limited by a semaphore instead of threads"""
+        results = ResultList() if results is None else results
+        pacer = RequestPacer(rps)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def _send():
+            async with semaphore:
+                if (delay := pacer.reserve()) > 0:
+                    await asyncio.sleep(delay)
+                return await self.request(method, url, **kwargs)
+
+        # Bounded batches keep the amount of pending coroutines (and unconsumed Results) limited
+        batch_size = max(concurrency, 1) * 10
+        for start in range(0, count, batch_size):
+            results.extend(await asyncio.gather(*(_send() for _ in range(min(batch_size, count - start)))))
+        return results
+
+    async def get_many(
+        self,
+        url,
+        count,
+        *,
+        params=None,
+        headers=None,
+        auth=None,
+        concurrency: int = 1,
+        rps: float = None,
+        results: ResultList | ResultSummary | None = None,
+    ) -> ResultList | ResultSummary:
+        """Send multiple `GET` requests."""
+        return await self.request_many(
+            "GET",
+            url,
+            count,
+            params=params,
+            headers=headers,
+            auth=auth,
+            concurrency=concurrency,
+            rps=rps,
+            results=results,
+        )
+
+
+class AsyncForceSNIClient(AsyncKuadrantClient):
+    """Async Kuadrant client that forces SNI for each request"""
+
+    def __init__(
+        self,
+        *,
+        verify: Union[Certificate, bool] = True,
+        cert: Certificate = None,
+        retry_codes: Iterable[int] = None,
+        sni_hostname: str = None,
+        **kwargs,
+    ):
+        self.sni_hostname = sni_hostname
+        super().__init__(verify=verify, cert=cert, retry_codes=retry_codes, **kwargs)
+
+    def build_request(self, *args, extensions=None, **kwargs):
+        extensions = extensions or {}
+        extensions.setdefault("sni_hostname", self.sni_hostname)
+        return super().build_request(*args, extensions=extensions, **kwargs)
+
+
+def run_batch(*coroutines: Awaitable[T]) -> list[T]:
+    """
+    Runs coroutines concurrently from synchronous code and returns their results in the given order.
+    Every call uses a new event loop, so async clients need to be created (and closed) within the coroutines, e.g.
+
+        async def _send(client):
+            async with AsyncKuadrantClient.from_client(client) as async_client:
+                return await async_client.get_many("/get", 10)
+
+        responses1, responses2 = run_batch(_send(client1), _send(client2))
+    """
+
+    async def _gather():
+        return await asyncio.gather(*coroutines)
+
+    return asyncio.run(_gather())
@@ -0,0 +1,93 @@
+"""HDR-style latency histogram with bounded memory"""
+
+import math
+from collections import Counter
+
+# Smallest distinguishable latency, everything below is recorded into the first bucket
+RESOLUTION = 1e-6
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies (in seconds) with logarithmic buckets.
+    Every reported value is within `precision` relative error of the recorded one,
+    the memory usage depends only on the range of the values, not on how many were recorded.
+    """
+
+    def __init__(self, precision: float = 0.01):
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self.buckets: Counter[int] = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float):
+        """Records single latency"""
+        self.buckets[int(math.log(max(value, RESOLUTION) / RESOLUTION) / self._log_base)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Adds all values recorded in other histogram with the same precision into this one"""
+        if other.precision != self.precision:
+            raise ValueError("Only histograms with the same precision can be merged")
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> float:
+        """Returns the highest latency within the given percentile (0-100), 0 if nothing was recorded"""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        cumulative = 0
+        for bucket in sorted(self.buckets):
+            cumulative += self.buckets[bucket]
+            if cumulative >= rank:
+                return min(RESOLUTION * math.exp((bucket + 1) * self._log_base), self.max)
+        return self.max
+
+    @property
+    def p50(self) -> float:
+        """Median latency"""
+        return self.percentile(50)
+
+    @property
+    def p90(self) -> float:
+        """90th percentile latency"""
+        return self.percentile(90)
+
+    @property
+    def p99(self) -> float:
+        """99th percentile latency"""
+        return self.percentile(99)
+
+    @property
+    def p999(self) -> float:
+        """99.9th percentile latency"""
+        return self.percentile(99.9)
+
+    def assert_percentile(self, percentile: float, budget: float):
+        """Assert that the percentile (0-100) of recorded latencies is within budget (in seconds)"""
+        actual = self.percentile(percentile)
+        assert actual <= budget, f"Latency p{percentile} {actual:.4f}s exceeded budget {budget:.4f}s: {self}"
+
+    @property
+    def mean(self) -> float:
+        """Arithmetic mean of all recorded latencies"""
+        return self.total / self.count if self.count else 0.0
+
+    def __len__(self):
+        return self.count
+
+    def __str__(self):
+        return (
+            f"LatencyHistogram[count={self.count}, p50={self.p50:.4f}s, p90={self.p90:.4f}s, "
+            f"p99={self.p99:.4f}s, p999={self.p999:.4f}s, max={self.max:.4f}s]"
+        )
@@ -0,0 +1,206 @@
+"""
+Open-loop traffic generator, which sends requests at a given arrival rate regardless of how fast the server responds.
+Unlike closed-loop get_many(), slow responses do not slow down the sending, so they can't hide (coordinated omission).
+"""
+
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from httpx import Client, RequestError
+
+from testsuite.httpx import KuadrantClient
+from testsuite.httpx.histogram import LatencyHistogram
+
+
+@dataclass
+class Sample:
+    """Single request sent by the generator, all times are in seconds from the start of the run"""
+
+    scheduled: float
+    sent: float
+    finished: float
+    status_code: int | None  # None if the request failed without response
+
+    @property
+    def delay(self) -> float:
+        """How late was the request sent compared to its schedule"""
+        return self.sent - self.scheduled
+
+    @property
+    def latency(self) -> float:
+        """Latency measured from the scheduled time, i.e. corrected for coordinated omission"""
+        return self.finished - self.scheduled
+
+
+@dataclass
+class Window:
+    """Requests scheduled within a single time window"""
+
+    start: float
+    accepted: int = 0
+    limited: int = 0
+    failed: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of all requests in the window"""
+        return self.accepted + self.limited + self.failed
+
+    @property
+    def accepted_ratio(self) -> float:
+        """Ratio of accepted requests to all requests in the window"""
+        return self.accepted / self.total if self.total else 0.0
+
+
+class OpenLoopResult:
+    """Samples of a single open-loop run"""
+
+    def __init__(self, samples: list[Sample], duration: float, accepted_code: int = 200, limited_code: int = 429):
+        self.samples = samples
+        self.duration = duration
+        self.accepted_code = accepted_code
+        self.limited_code = limited_code
+
+    def count(self, status_code: int | None) -> int:
+        """Number of requests that ended with the status code, None counts failed requests"""
+        return sum(1 for sample in self.samples if sample.status_code == status_code)
+
+    @property
+    def accepted(self) -> int:
+        """Number of accepted requests"""
+        return self.count(self.accepted_code)
+
+    @property
+    def limited(self) -> int:
+        """Number of rate limited requests"""
+        return self.count(self.limited_code)
+
+    def windows(self, size: float) -> list[Window]:
+        """Returns accepted/limited counts of requests by the window of their scheduled time"""
+        windows = [Window(i * size) for i in range(math.ceil(self.duration / size))]
+        for sample in self.samples:
+            window = windows[min(int(sample.scheduled / size), len(windows) - 1)]
+            if sample.status_code == self.accepted_code:
+                window.accepted += 1
+            elif sample.status_code == self.limited_code:
+                window.limited += 1
+            else:
+                window.failed += 1
+        return windows
+
+    def send_delay(self) -> LatencyHistogram:
+        """Histogram of delays between scheduled and actual send times"""
+        histogram = LatencyHistogram()
+        for sample in self.samples:
+            histogram.record(sample.delay)
+        return histogram
+
+    def latency(self) -> LatencyHistogram:
+        """Histogram of latencies corrected for coordinated omission"""
+        histogram = LatencyHistogram()
+        for sample in self.samples:
+            histogram.record(sample.latency)
+        return histogram
+
+    def assert_limit(self, limit: int, window: float, tolerance: float = 0.1):
+        """
+        Assert that number of accepted requests matches `limit` requests per `window` seconds within relative tolerance.
+        Limitador windows start with the first request, so with traffic exceeding the limit they follow each other,
+        which means that `limit` requests are accepted in every started window.
+        """
+        expected = limit * math.ceil(self.duration / window)
+        windows = "".join(
+            f"\n  {i.start:6.1f}s {i.accepted:5d} accepted {i.limited:5d} limited" for i in self.windows(window)
+        )
+        assert (
+            abs(self.accepted - expected) <= tolerance * expected
+        ), f"Expected {expected}±{tolerance:.0%} accepted requests, got {self.accepted}: {self}{windows}"
+
+    def assert_no_failures(self):
+        """Assert that every request got either accepted or limited response"""
+        other = len(self.samples) - self.accepted - self.limited
+        assert other == 0, f"{other} requests were neither accepted nor limited: {self}"
+
+    def __str__(self):
+        return (
+            f"OpenLoopResult[requests={len(self.samples)}, accepted={self.accepted}, limited={self.limited}, "
+            f"send_delay={self.send_delay()}, latency={self.latency()}]"
+        )
+
+
+class OpenLoopGenerator:
+    """Sends requests with constant or Poisson-distributed arrival times for a fixed duration"""
+
+    def __init__(
+        self,
+        client: KuadrantClient,
+        rate: float,
+        duration: float,
+        poisson: bool = False,
+        max_workers: int = 200,
+        seed: int = None,
+    ):
+        """
+        :param client: Client to send the requests with
+        :param rate: Average number of requests per second
+        :param duration: Duration of the run in seconds
+        :param poisson: Use exponentially distributed inter-arrival times instead of constant ones
+        :param max_workers: Maximum number of requests in flight, if exhausted, requests are sent late,
+            which is recorded in the samples
+        :param seed: Seed for Poisson arrivals
+        """
+        self.client = client
+        self.rate = rate
+        self.duration = duration
+        self.poisson = poisson
+        self.max_workers = max_workers
+        self.random = random.Random(seed)
+
+    def schedule(self) -> list[float]:
+        """Returns send times of all requests, in seconds from the start"""
+        if not self.poisson:
+            return [i / self.rate for i in range(int(self.duration * self.rate))]
+        times = []
+        current = self.random.expovariate(self.rate)
+        while current < self.duration:
+            times.append(current)
+            current += self.random.expovariate(self.rate)
+        return times
+
+    def run(self, method: str, url, accepted_code: int = 200, limited_code: int = 429, **kwargs) -> OpenLoopResult:
+        """
+        Sends the requests according to the schedule and waits for all of them to finish.
+        Connection errors are recorded as samples without status code, any other error is raised.
+        """
+        samples: list[Sample] = []
+        lock = threading.Lock()
+        start = time.perf_counter()
+
+        def _send(scheduled):
+            sent = time.perf_counter() - start
+            try:
+                # Retries of KuadrantClient would turn one scheduled arrival into several, so they are bypassed
+                status_code = Client.request(self.client, method, url, **kwargs).status_code
+            except RequestError:
+                status_code = None
+            sample = Sample(scheduled, sent, time.perf_counter() - start, status_code)
+            with lock:
+                samples.append(sample)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
+            for scheduled in self.schedule():
+                delay = scheduled - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(_send, scheduled))
+        # Unexpected errors would otherwise silently drop their samples
+        for future in futures:
+            future.result()
+
+        samples.sort(key=lambda sample: sample.scheduled)
+        return OpenLoopResult(samples, self.duration, accepted_code, limited_code)
@@ -0,0 +1,93 @@
+"""Request and response bodies that are streamed instead of being buffered in memory"""
+
+import hashlib
+import mmap
+import os
+from typing import Iterator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class StreamedBody:
+    """Length and digest of a response body, which was read incrementally and dropped"""
+
+    def __init__(self, algorithm: str = "sha256"):
+        self.algorithm = algorithm
+        self.length = 0
+        self.chunks = 0
+        self._hash = hashlib.new(algorithm)
+
+    def update(self, chunk: bytes):
+        """Adds next chunk of the body"""
+        self.length += len(chunk)
+        self.chunks += 1
+        self._hash.update(chunk)
+
+    @property
+    def digest(self) -> str:
+        """Hex digest of the whole body"""
+        return self._hash.hexdigest()
+
+    def __str__(self):
+        return f"StreamedBody[length={self.length}, {self.algorithm}={self.digest}]"
+
+
+class MappedFile:
+    """
+    Request body sent from a memory-mapped file, only one chunk is copied in memory at a time.
+    It can be iterated repeatedly, so retried requests send the whole body again.
+    """
+
+    def __init__(self, path: str | os.PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return os.path.getsize(self.path)
+
+    def __iter__(self) -> Iterator[bytes]:
+        if len(self) == 0:
+            return
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset in range(0, len(mapped), self.chunk_size):
+                yield mapped[offset : offset + self.chunk_size]
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers needed to send the body with known length instead of chunked transfer encoding"""
+        return {"Content-Length": str(len(self))}
+
+
+class RepeatedContent:
+    """
+    Request body of arbitrary size generated by repeating a chunk of data, e.g. MESSAGE_1KB, without buffering it.
+    It can be iterated repeatedly, so retried requests send the whole body again.
+    """
+
+    def __init__(self, data: bytes, size: int):
+        if not data:
+            raise ValueError("Data to repeat can't be empty")
+        self.data = data
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        full, remainder = divmod(self.size, len(self.data))
+        for _ in range(full):
+            yield self.data
+        if remainder:
+            yield self.data[:remainder]
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers needed to send the body with known length instead of chunked transfer encoding"""
+        return {"Content-Length": str(len(self))}
+
+    def digest(self, algorithm: str = "sha256") -> str:
+        """Hex digest of the whole body, computed incrementally"""
+        body = StreamedBody(algorithm)
+        for chunk in self:
+            body.update(chunk)
+        return body.digest
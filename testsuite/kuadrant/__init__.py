@@ -2,12 +2,11 @@
 
 import dataclasses
 
-from openshift_client import selector
-
 from testsuite.kuadrant.authorino import Authorino, AuthorinoCR
 from testsuite.kuadrant.limitador import LimitadorCR
 from testsuite.kubernetes import CustomResource, modify
 from testsuite.kubernetes.deployment import Deployment
+from testsuite.kubernetes.informer import INFORMER
 from testsuite.utils import asdict
 
 
@@ -26,8 +25,7 @@ class KuadrantSection:
     @property
     def deployment(self):
         """Returns Deployment object for CR"""
-        with self.context:
-            return selector("deployment", labels={"app": self.spec_name}).object(cls=Deployment)
+        return INFORMER.object(self.context, "apps/v1", "Deployment", labels={"app": self.spec_name}, cls=Deployment)
 
     def name(self):
         """Overrides `name` method from `apiobject` so it returns name of Kuadrant section"""
@@ -55,8 +53,7 @@ class KuadrantCR(CustomResource):
     @property
     def authorino(self) -> AuthorinoCR:
         """Returns associated default AuthorinoCR object"""
-        with self.context:
-            return selector("authorino").object(cls=AuthorinoCR)
+        return INFORMER.object(self.context, "operator.authorino.kuadrant.io/v1beta1", "Authorino", cls=AuthorinoCR)
 
     @modify
     def set_observability(self, enabled: bool):
@@ -66,5 +63,4 @@ class KuadrantCR(CustomResource):
     @property
     def limitador(self) -> LimitadorCR:
         """Returns associated default LimitadorCR object"""
-        with self.context:
-            return selector("limitador").object(cls=LimitadorCR)
+        return INFORMER.object(self.context, "limitador.kuadrant.io/v1alpha1", "Limitador", cls=LimitadorCR)
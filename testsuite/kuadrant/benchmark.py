@@ -0,0 +1,127 @@
+"""
+Policy reconciliation throughput, how many policies per second Kuadrant enforces when a batch of them is created,
+updated or deleted at once. Results are stored as JSON and compared against results of a previous run.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Callable, Sequence
+
+from testsuite import thread_pool
+from testsuite.gateway.gateway_api.route import HTTPRoute
+from testsuite.kuadrant.policy import Policy, has_condition, has_observed_generation
+from testsuite.kuadrant.policy.rate_limit import Limit
+from testsuite.kuadrant.scale import PolicyFactory, ScaleGenerator, rate_limit_policy
+from testsuite.lifecycle import ReadinessBarrier
+
+logger = logging.getLogger(__name__)
+
+
+def enforced(policy: Policy) -> Callable[[Policy], bool]:
+    """
+    Returns function that returns True if the current generation of the policy is Enforced. Unlike wait_for_ready()
+    it has no fixed sleeps, which would be included in the measured time.
+    """
+    observed = has_observed_generation(policy.generation)
+    condition = has_condition("Enforced", "True", "Enforced")
+
+    def _check(obj):
+        return observed(obj) and condition(obj)
+
+    return _check
+
+
+def not_affected_by(policy: Policy) -> Callable[[HTTPRoute], bool]:
+    """Returns function that returns True if the route is no longer affected by the policy"""
+
+    def _check(obj):
+        return not obj.is_affected_by(policy)
+
+    return _check
+
+
+class PolicyThroughput:
+    """Measures throughput of policy batches, every policy of a batch targets a different HTTPRoute"""
+
+    def __init__(self, generator: ScaleGenerator, factory: PolicyFactory = rate_limit_policy, max_waits: int = 100):
+        """
+        :param generator: Commits the policies with its parallelism, names and labels
+        :param factory: Creates the policies, update adds a limit to them, so they need to be RateLimitPolicies
+        """
+        self.generator = generator
+        self.factory = factory
+        self.max_waits = max_waits
+        self.results: list[dict] = []
+        self._batches = 0
+
+    def _concurrently(self, func: Callable[[Any], Any], objects: Sequence):
+        with thread_pool(self.generator.max_workers) as executor:
+            for _ in executor.map(func, objects):
+                pass
+
+    def _wait(self, objects: Sequence, predicates: Sequence[Callable[[Any], bool]]):
+        barrier = ReadinessBarrier(max_workers=self.max_waits)
+        for obj, predicate in zip(objects, predicates):
+            barrier.add(obj, predicate, timelimit=300)
+        barrier.wait()
+
+    def _record(self, operation: str, batch: int, start: float):
+        seconds = time.monotonic() - start
+        result = {"operation": operation, "batch": batch, "seconds": seconds, "throughput": batch / seconds}
+        logger.info("%s of %s policies took %.1fs (%.2f/s)", operation, batch, seconds, result["throughput"])
+        self.results.append(result)
+
+    def run(self, routes: Sequence[HTTPRoute]):
+        """
+        Creates a policy for every route and waits until all are enforced, then adds a limit to all of them
+        and waits until the change is enforced, then deletes them and waits until the routes are no longer affected
+        """
+        batch = len(routes)
+        self._batches += 1
+        names = (f"{self.generator.name}-b{self._batches}-{i}" for i in range(batch))
+        policies: list[Policy] = [
+            self.factory(self.generator.cluster, name, route, self.generator.labels)
+            for name, route in zip(names, routes)
+        ]
+
+        start = time.monotonic()
+        self.generator.commit(policies)
+        self._wait(policies, [enforced(policy) for policy in policies])
+        self._record("create", batch, start)
+
+        start = time.monotonic()
+        self._concurrently(lambda policy: policy.add_limit("update", [Limit(10, "10s")]), policies)
+        self._wait(policies, [enforced(policy) for policy in policies])
+        self._record("update", batch, start)
+
+        start = time.monotonic()
+        self._concurrently(lambda policy: policy.delete(), policies)
+        self._wait(routes, [not_affected_by(policy) for policy in policies])
+        self._record("delete", batch, start)
+
+
+def write_report(results: list[dict], path: str):
+    """Writes throughput results to the JSON file"""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"results": results}, file, indent=2)
+
+
+def load_report(path: str) -> list[dict]:
+    """Reads throughput results from the JSON file written by write_report()"""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def regressions(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """
+    Returns descriptions of operations and batch sizes whose throughput decreased by more than the threshold
+    (e.g. 0.2 for 20 %) against the baseline. Results missing in either of them are not compared.
+    """
+    expected = {(result["operation"], result["batch"]): result["throughput"] for result in baseline}
+    found = []
+    for result in results:
+        key = (result["operation"], result["batch"])
+        if key in expected and result["throughput"] < expected[key] * (1 - threshold):
+            found.append(f"{key[0]} of {key[1]} policies: {result['throughput']:.2f}/s, baseline {expected[key]:.2f}/s")
+    return found
@@ -1,16 +1,31 @@
 """Limitador CR object"""
 
+import json
+import time
 from abc import ABC
 from dataclasses import dataclass
-from typing import Optional, Literal
+from typing import Callable, Optional, Literal, cast
+from urllib.parse import quote
 
-from openshift_client import selector
+import openshift_client as oc
 
 from testsuite.kubernetes import CustomResource, modify
 from testsuite.kubernetes.deployment import Deployment
+from testsuite.kubernetes.informer import INFORMER
 from testsuite.utils import asdict
 
 
+def _limit_key(limit: dict) -> tuple:
+    """Returns comparable definition of a limit, either from the Limitador CR or from the Limitador HTTP API"""
+    return (
+        limit.get("maxValue", limit.get("max_value")),
+        limit["seconds"],
+        limit.get("name"),
+        tuple(sorted(limit.get("conditions") or [])),
+        tuple(sorted(limit.get("variables") or [])),
+    )
+
+
 @dataclass
 class ABCStorage(ABC):
     """
@@ -106,11 +121,50 @@ class LimitadorCR(CustomResource):
     @property
     def deployment(self) -> Deployment:
         """Returns Deployment object for this Limitador"""
-        with self.context:
-            return selector("deployment", labels={"app": self.name()}).object(cls=Deployment)
+        return INFORMER.object(self.context, "apps/v1", "Deployment", labels={"app": self.name()}, cls=Deployment)
 
     @property
     def pod(self):
         """Returns Pod object for this Limitadaor"""
+        return INFORMER.object(self.context, "v1", "Pod", labels={"app": self.name()})
+
+    def loaded_limits(self, namespace: str) -> list[dict]:
+        """
+        Returns limits of the Limitador namespace which the running Limitador has loaded,
+        read from its HTTP API through the Kubernetes API server service proxy
+        """
+        path = (
+            f"/api/v1/namespaces/{self.namespace()}/services/limitador-{self.name()}:http/proxy"
+            f"/limits/{quote(namespace, safe='')}"
+        )
+        if (api := self.api) is not None:
+            return cast(list, api.request("GET", path))
         with self.context:
-            return selector("pod", labels={"app": self.name()}).object()
+            result = oc.invoke("get", ["--raw", path])
+        return json.loads(result.out())
+
+    def wait_for_limits_loaded(
+        self, generated_by: Callable[[dict], bool], timelimit: float = 30, interval: float = 0.5
+    ) -> bool:
+        """
+        Waits until the running Limitador serves the limits from the current spec for which `generated_by` is True,
+        which takes a while as they are propagated through a mounted ConfigMap.
+        Returns False if there are no such limits or if they didn't get loaded in time.
+        """
+        self.refresh()
+        expected: dict[str, set[tuple]] = {}
+        for limit in self.as_dict()["spec"].get("limits") or []:
+            if generated_by(limit):
+                expected.setdefault(limit["namespace"], set()).add(_limit_key(limit))
+        if not expected:
+            return False
+        deadline = time.monotonic() + timelimit
+        while True:
+            loaded = {
+                namespace: {_limit_key(limit) for limit in self.loaded_limits(namespace)} for namespace in expected
+            }
+            if all(limits <= loaded[namespace] for namespace, limits in expected.items()):
+                return True
+            if time.monotonic() + interval > deadline:
+                return False
+            time.sleep(interval)
@@ -14,14 +14,14 @@ class Strategy(Enum):
     MERGE = "merge"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CelPredicate:
     """Dataclass that references CEL predicate e.g. auth.identity.anonymous == 'true'"""
 
     predicate: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class CelExpression:
     """Dataclass that references CEL expression"""
 
@@ -82,6 +82,7 @@ class Policy(KubernetesObject):
         """Wait for a Policy to be Accepted"""
         success = self.wait_until(has_condition("Accepted", "True"))
         assert success, f"{self.kind()} did not get accepted in time"
+        self.record_reconcile("Accepted")
 
     def wait_for_partial_enforced(self):
         """Wait for a Policy to be partially Enforced"""
@@ -89,6 +90,7 @@ class Policy(KubernetesObject):
             has_condition("Enforced", "True", "Enforced", f"{self.kind(False)} has been partially enforced")
         )
         assert success, f"{self.kind(False)} did not get partially enforced in time"
+        self.record_reconcile("PartiallyEnforced")
 
     def wait_for_full_enforced(self, timelimit=60):
         """Wait for a Policy to be fully Enforced"""
@@ -97,6 +99,7 @@ class Policy(KubernetesObject):
             timelimit=timelimit,
         )
         assert success, f"{self.kind()} didn't reach required state, instead it was: {self.model.status.conditions}"
+        self.record_reconcile("Enforced")
 
     @property
     def generation(self):
@@ -3,11 +3,14 @@
 from functools import cached_property
 from typing import Dict
 
+from testsuite.config import settings
 from testsuite.gateway import Referencable
+from testsuite.httpx import KuadrantClient
 from testsuite.kubernetes import modify
 from testsuite.kubernetes.client import KubernetesClient
 from testsuite.utils import asdict
 from .auth_config import AuthConfig
+from .propagation import PropagationProbe
 from .sections import ResponseSection
 from .. import Policy, CelPredicate, Strategy
 from . import Pattern
@@ -43,6 +46,25 @@ class AuthPolicy(Policy, AuthConfig):
 
         return cls(model, context=cluster.context)
 
+    def wait_for_ready(self, timelimit=60):
+        """Waits until the AuthPolicy is enforced, then until Authorino serves its AuthConfigs within the timelimit"""
+        super().wait_for_ready()
+        self.propagation_probe().wait(timelimit=timelimit)
+
+    def wait_for_live(self, client: KuadrantClient, path="/", expected_status=None, timelimit=30, **kwargs):
+        """
+        Waits until canary requests through the client get the expected response (any non-retried one by default),
+        kwargs (e.g. `auth`) are passed to the requests. Returns seconds it took since the commit, None on timeout.
+        """
+        return self.propagation_probe().wait(client, path, expected_status, timelimit, **kwargs)
+
+    def propagation_probe(self) -> PropagationProbe:
+        """Returns data-plane propagation probe of this AuthPolicy"""
+        system_project = KubernetesClient.from_context(self.context).change_project(
+            settings["service_protection"]["system_project"]
+        )
+        return PropagationProbe(self, system_project.context)
+
     @modify
     def add_rule(self, when: list[CelPredicate]):
         """Add rule for the skip of entire AuthPolicy"""
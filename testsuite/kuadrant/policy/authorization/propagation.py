@@ -0,0 +1,118 @@
+"""
+Data-plane propagation probe for AuthPolicies. Enforced condition means that Kuadrant has created the AuthConfigs,
+not that Authorino and the wasm-shim in the gateway already serve them.
+"""
+
+import logging
+import re
+import time
+import uuid
+from typing import Iterable
+
+import httpx
+from openshift_client import Context
+
+from testsuite.httpx import KuadrantClient
+from testsuite.kubernetes.informer import INFORMER
+
+logger = logging.getLogger(__name__)
+
+# Header of the canary requests, so that they can be told apart in logs and traces
+PROBE_HEADER = "X-Kuadrant-Propagation-Probe"
+
+
+def is_live(auth_config: dict) -> bool:
+    """Returns True if Authorino reports the AuthConfig as ready and all its hosts are in its host index"""
+    status = auth_config.get("status") or {}
+    ready = any(c["type"] == "Ready" and c["status"] == "True" for c in status.get("conditions") or [])
+    hosts_ready = set((status.get("summary") or {}).get("hostsReady") or [])
+    return ready and set(auth_config["spec"].get("hosts") or []) <= hosts_ready
+
+
+class PropagationProbe:
+    """Waits until an AuthPolicy is live on the data plane and records the time it took as its reconcile latency"""
+
+    def __init__(self, policy, system_context: Context, interval: float = 0.5):
+        """
+        :param policy: AuthPolicy to probe, it needs to be committed
+        :param system_context: Context of the Kuadrant system namespace, where Kuadrant creates the AuthConfigs
+        """
+        self.policy = policy
+        self.system_context = system_context
+        self.interval = interval
+
+    def references(self, auth_config: dict) -> bool:
+        """
+        Returns True if labels or annotations of the AuthConfig reference the policy or its target,
+        e.g. in the topology path of the AuthConfig, by `namespace/name` alone or prefixed by the kind
+        """
+        target = self.policy.model.spec.targetRef
+        keys = {
+            f"{self.policy.namespace()}/{self.policy.name()}",
+            f"{self.policy.namespace()}/{target.name}",
+        }
+        metadata = auth_config["metadata"]
+        values = [*(metadata.get("labels") or {}).values(), *(metadata.get("annotations") or {}).values()]
+        return any(
+            part in keys or part.rpartition(":")[2] in keys for value in values for part in re.split(r"[|,\s]+", value)
+        )
+
+    def auth_configs(self) -> list[dict]:
+        """Returns AuthConfigs generated for the policy, there are none until Kuadrant reconciles it"""
+        auth_configs = INFORMER.list(self.system_context, "authorino.kuadrant.io/v1beta3", "AuthConfig")
+        return [obj for obj in auth_configs if self.references(obj)]
+
+    def pending_auth_configs(self) -> list[str]:
+        """Returns names of the AuthConfigs generated for the policy which Authorino doesn't serve yet"""
+        return [obj["metadata"]["name"] for obj in self.auth_configs() if not is_live(obj)]
+
+    def canary(self, client: KuadrantClient, path: str, expected_status: Iterable[int] | None, **kwargs) -> bool:
+        """
+        Sends a single canary request, without retries, and returns True if the response
+        has one of the expected status codes, or any status code which the client would not retry
+        """
+        headers = {**kwargs.pop("headers", {}), PROBE_HEADER: str(uuid.uuid4())}
+        try:
+            response = httpx.Client.request(client, "GET", path, headers=headers, **kwargs)
+        except httpx.RequestError as e:
+            logger.debug("Canary request failed: %s", e)
+            return False
+        if expected_status is not None:
+            return response.status_code in expected_status
+        return response.status_code not in client.retry_codes
+
+    def wait(
+        self,
+        client: KuadrantClient = None,
+        path: str = "/",
+        expected_status: Iterable[int] = None,
+        timelimit: float = 30,
+        **kwargs,
+    ) -> float | None:
+        """
+        Waits until Kuadrant generates AuthConfigs of the policy and Authorino serves all of them and,
+        if the client is given, until a canary request (signed by the `auth` kwarg if needed) gets the expected
+        response through the gateway.
+        Returns seconds since the commit (or the last modification) of the policy,
+        or None if the policy didn't get live in time, which is only logged.
+        """
+        deadline = time.monotonic() + timelimit
+        while True:
+            auth_configs = self.auth_configs()
+            pending = [obj["metadata"]["name"] for obj in auth_configs if not is_live(obj)]
+            if (
+                auth_configs
+                and not pending
+                and (client is None or self.canary(client, path, expected_status, **dict(kwargs)))
+            ):
+                break
+            if time.monotonic() + self.interval > deadline:
+                logger.warning(
+                    "%s did not get live in %ss, AuthConfigs not served yet: %s",
+                    self.policy.name(),
+                    timelimit,
+                    pending if auth_configs else "none generated",
+                )
+                return None
+            time.sleep(self.interval)
+        return self.policy.record_reconcile("Live")
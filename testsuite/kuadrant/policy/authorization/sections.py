@@ -60,6 +60,14 @@ class Section:
 
         return self.obj.modify_and_apply(_new_modifier, retries, cmd_args)
 
+    def modify_and_patch(self, modifier_func, retries=2):
+        """Reimplementation of modify_and_patch from KubernetesObject"""
+
+        def _new_modifier(obj):
+            modifier_func(self.__class__(obj, self.section_name))
+
+        return self.obj.modify_and_patch(_new_modifier, retries)
+
     @property
     def committed(self):
         """Reimplementation of commit from OpenshiftObject"""
@@ -9,6 +9,7 @@ import openshift_client as oc
 from testsuite.gateway import Referencable
 from testsuite.kubernetes import KubernetesObject
 from testsuite.kubernetes.client import KubernetesClient
+from testsuite.kubernetes.informer import INFORMER
 from testsuite.kuadrant.policy import Policy
 from testsuite.utils import asdict, check_condition
 
@@ -181,9 +182,8 @@ class DNSPolicy(Policy):
 
     def get_dns_records(self) -> list[DNSRecord]:
         """Returns DNSRecord objects for the created DNSPolicy"""
-        with self.context:
-            dns_records = self.get_owned("dnsrecord.kuadrant.io")
-            return [DNSRecord(x.model, context=self.context) for x in dns_records]
+        dns_records = INFORMER.owned(self.context, "kuadrant.io/v1alpha1", "DNSRecord", self.model.metadata.uid)
+        return [DNSRecord(x, context=self.context) for x in dns_records]
 
     def get_dns_health_probe(self) -> DNSHealthCheckProbe:
         """Returns DNSHealthCheckProbe object for the created DNSPolicy"""
@@ -192,12 +192,14 @@ class DNSPolicy(Policy):
         ), "The corresponding DNSRecord object wasn't created in time"
         dns_record = self.get_dns_records()[0]
 
-        with self.context:
-            assert dns_record.wait_until(
-                lambda obj: len(obj.get_owned("DNSHealthCheckProbe")) > 0
-            ), "The corresponding DNSHealthCheckProbe object wasn't created in time"
-            dns_probe = dns_record.get_owned("DNSHealthCheckProbe")[0]
-        return DNSHealthCheckProbe(dns_probe.model, context=self.context)
+        def _probes():
+            uid = dns_record.model.metadata.uid
+            return INFORMER.owned(self.context, "kuadrant.io/v1alpha1", "DNSHealthCheckProbe", uid)
+
+        assert dns_record.wait_until(
+            lambda _: len(_probes()) > 0
+        ), "The corresponding DNSHealthCheckProbe object wasn't created in time"
+        return DNSHealthCheckProbe(_probes()[0], context=self.context)
 
     def wait_for_full_enforced(self, timelimit=300):
         """Wait for a Policy to be fully Enforced with increased timelimit for DNSPolicy"""
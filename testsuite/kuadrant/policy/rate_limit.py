@@ -1,17 +1,26 @@
 """RateLimitPolicy related objects"""
 
+import logging
+import re
 import time
 from dataclasses import dataclass
 from typing import Iterable
 
+from openshift_client import OpenShiftPythonException
+
+from testsuite.config import settings
 from testsuite.gateway import Referencable
+from testsuite.kuadrant.limitador import LimitadorCR, _limit_key
 from testsuite.kubernetes import modify
 from testsuite.kubernetes.client import KubernetesClient
+from testsuite.kubernetes.informer import INFORMER
 from testsuite.kuadrant.policy import Policy, CelPredicate, CelExpression, Strategy
 from testsuite.utils import asdict
 
+logger = logging.getLogger(__name__)
+
 
-@dataclass
+@dataclass(frozen=True)
 class Limit:
     """Limit dataclass"""
 
@@ -19,6 +28,12 @@ class Limit:
     window: str
 
 
+def _seconds(window: str) -> int:
+    """Returns length of the window (e.g. 10s, 1m, 1h30m) in whole seconds, as Limitador stores it"""
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return int(sum(int(value) * units[unit] for value, unit in re.findall(r"(\d+)(ms|s|m|h)", window)))
+
+
 class RateLimitPolicy(Policy):
     """RateLimitPolicy (or RLP for short) object, used for applying rate limiting rules to a Gateway/HTTPRoute"""
 
@@ -111,7 +126,40 @@ class RateLimitPolicy(Policy):
         return self
 
     def wait_for_ready(self):
-        """Wait for RLP to be enforced"""
+        """Wait for RLP to be enforced and its limits loaded by Limitador"""
         super().wait_for_ready()
-        # Even after enforced condition RLP requires a short sleep
-        time.sleep(5)
+        # Even after enforced condition Limitador needs a moment to load the limits
+        try:
+            loaded = self.limitador().wait_for_limits_loaded(self.generated)
+        except (OpenShiftPythonException, ValueError) as e:
+            logger.debug("Limits of %s can't be checked in Limitador: %s", self.name(), e)
+            loaded = False
+        if not loaded:
+            time.sleep(5)
+
+    def generated(self, limit: dict) -> bool:
+        """
+        Returns True if the limit of the Limitador CR was generated from a limit of this RLP, as far as it can be
+        told without the hash Kuadrant adds to limit identifiers: by the limit name in its conditions, by its rate
+        and, for RLPs targeting an HTTPRoute, by the Limitador namespace of the route
+        """
+        target = self.model.spec.targetRef
+        if target.kind == "HTTPRoute" and limit.get("namespace") != f"{self.namespace()}/{target.name}":
+            return False
+        spec = self.as_dict()["spec"]
+        for section in (spec, spec.get("defaults") or {}, spec.get("overrides") or {}):
+            for name, definition in (section.get("limits") or {}).items():
+                identifier = f'"limit.{re.sub("[^a-zA-Z0-9_]", "_", name)}__'
+                if any(identifier in condition for condition in limit.get("conditions") or []) and any(
+                    (rate["limit"], _seconds(rate["window"])) == _limit_key(limit)[:2]
+                    for rate in definition.get("rates") or []
+                ):
+                    return True
+        return False
+
+    def limitador(self) -> LimitadorCR:
+        """Returns Limitador which enforces the limits of this RLP"""
+        system_project = KubernetesClient.from_context(self.context).change_project(
+            settings["service_protection"]["system_project"]
+        )
+        return INFORMER.object(system_project.context, "limitador.kuadrant.io/v1alpha1", "Limitador", cls=LimitadorCR)
@@ -0,0 +1,172 @@
+"""
+Scale generator, creates topologies of N Gateways with M listeners each, an HTTPRoute for every listener
+and K policies for every HTTPRoute, from the same classes as the rest of the testsuite
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from testsuite import thread_pool
+from testsuite.backend import Backend
+from testsuite.gateway import GatewayListener, Referencable
+from testsuite.gateway.gateway_api.gateway import KuadrantGateway
+from testsuite.gateway.gateway_api.route import HTTPRoute
+from testsuite.kuadrant.policy import Policy
+from testsuite.kuadrant.policy.authorization.auth_policy import AuthPolicy
+from testsuite.kuadrant.policy.rate_limit import Limit, RateLimitPolicy
+from testsuite.kubernetes import KubernetesObject
+from testsuite.kubernetes.cleanup import LabelCleanup
+from testsuite.kubernetes.client import KubernetesClient
+from testsuite.lifecycle import ReadinessBarrier
+
+logger = logging.getLogger(__name__)
+
+# Creates policy with the name and labels for the target
+PolicyFactory = Callable[[KubernetesClient, str, Referencable, dict[str, str]], Policy]
+
+
+def auth_policy(cluster: KubernetesClient, name: str, target: Referencable, labels: dict[str, str]) -> AuthPolicy:
+    """AuthPolicy allowing anonymous access"""
+    policy = AuthPolicy.create_instance(cluster, name, target, labels=labels)
+    policy.identity.add_anonymous("anonymous")
+    return policy
+
+
+def rate_limit_policy(
+    cluster: KubernetesClient, name: str, target: Referencable, labels: dict[str, str]
+) -> RateLimitPolicy:
+    """RateLimitPolicy with a single limit"""
+    policy = RateLimitPolicy.create_instance(cluster, name, target, labels=labels)
+    policy.add_limit("basic", [Limit(5, "10s")])
+    return policy
+
+
+@dataclass
+class Topology:
+    """
+    N Gateways with M listeners each, every listener has its own HTTPRoute with K policies.
+    Policies of the same kind override each other, so the route policies should be of different kinds.
+    """
+
+    gateways: int
+    listeners: int
+    route_policies: Sequence[PolicyFactory] = (auth_policy, rate_limit_policy)
+    gateway_policies: Sequence[PolicyFactory] = ()
+
+    @property
+    def size(self) -> int:
+        """Number of all objects in the topology"""
+        routes = self.gateways * self.listeners
+        return self.gateways * (1 + len(self.gateway_policies)) + routes * (1 + len(self.route_policies))
+
+
+class ScaleGenerator:  # pylint: disable=too-many-instance-attributes
+    """
+    Creates topologies concurrently, at most `max_workers` objects are committed at once,
+    waits until all objects are ready and tears them down by their label
+    """
+
+    def __init__(
+        self,
+        cluster: KubernetesClient,
+        name: str,
+        backend: Backend,
+        base_domain: str,
+        label: str,
+        max_workers: int = 10,
+        max_waits: int = 100,
+    ):
+        """
+        :param name: Prefix of names of all objects, also used in hostnames
+        :param label: Value of the `app` label of all objects, by which they are deleted
+        :param max_waits: Number of objects waited for at once, time-to-ready is recorded when a wait sees the state
+        """
+        self.cluster = cluster
+        self.name = name
+        self.backend = backend
+        self.base_domain = base_domain
+        self.labels = {"app": label}
+        self.max_workers = max_workers
+        self.max_waits = max_waits
+        self.gateways: list[KuadrantGateway] = []
+        self.routes: list[HTTPRoute] = []
+        self.policies: list[Policy] = []
+        self.cleanup = LabelCleanup()
+        self.cleanup.add_client(cluster)
+        self.cleanup.add_label(label)
+
+    def hostname(self, gateway: int, listener: int) -> str:
+        """Returns hostname of the listener"""
+        return f"api-{listener}.gw{gateway}.{self.name}.{self.base_domain}"
+
+    def build(self, topology: Topology):
+        """Creates all objects of the topology without committing them, Gateways are built concurrently"""
+        first = len(self.gateways)
+        with thread_pool(self.max_workers) as executor:
+            built = list(
+                executor.map(lambda i: self._build_gateway(i, topology), range(first, first + topology.gateways))
+            )
+        for gateway, routes, policies in built:
+            self.gateways.append(gateway)
+            self.routes.extend(routes)
+            self.policies.extend(policies)
+
+    def _build_gateway(self, i: int, topology: Topology) -> tuple[KuadrantGateway, list[HTTPRoute], list[Policy]]:
+        """Creates i-th Gateway with its HTTPRoutes and all their policies"""
+        gateway = KuadrantGateway.create_instance(self.cluster, f"{self.name}-gw{i}", self.labels)
+        for j in range(topology.listeners):
+            gateway.add_listener(GatewayListener(name=f"api-{j}", hostname=self.hostname(i, j)))
+        policies = [
+            factory(self.cluster, f"{gateway.name()}-p{k}", gateway, self.labels)
+            for k, factory in enumerate(topology.gateway_policies)
+        ]
+
+        routes = []
+        for j in range(topology.listeners):
+            route = HTTPRoute.create_instance(self.cluster, f"{gateway.name()}-l{j}", gateway, self.labels)
+            route.add_hostname(self.hostname(i, j))
+            route.add_backend(self.backend)
+            routes.append(route)
+            for k, factory in enumerate(topology.route_policies):
+                policies.append(factory(self.cluster, f"{route.name()}-p{k}", route, self.labels))
+        return gateway, routes, policies
+
+    def create(self, topology: Topology) -> dict[str, float | None]:
+        """
+        Creates the topology, Gateways first, then HTTPRoutes and policies last, each after the previous are ready.
+        Returns seconds from commit until each object was Programmed, Ready or Enforced, by its kind/name.
+        """
+        start = (len(self.gateways), len(self.routes), len(self.policies))
+        self.build(topology)
+        tiers = zip((self.gateways, self.routes, self.policies), start, ("Programmed", "Ready", "Enforced"))
+        timings: dict[str, float | None] = {}
+        for objects, first, state in tiers:
+            created = objects[first:]
+            self.commit(created)
+            ReadinessBarrier(created, max_workers=self.max_waits).wait()
+            for obj in created:
+                timings[f"{obj.model.kind}/{obj.name()}"] = obj.record_reconcile(state)
+        logger.info("Created %s objects for %sx%s topology", len(timings), topology.gateways, topology.listeners)
+        return timings
+
+    def commit(self, objects: Sequence[KubernetesObject]):
+        """Commits the objects concurrently, raises the first error"""
+        with thread_pool(self.max_workers) as executor:
+            for _ in executor.map(lambda obj: obj.commit(), objects):
+                pass
+
+    def teardown(self) -> int:
+        """
+        Deletes all created objects by their label, then deletes the Gateways one by one, so that they also delete
+        the objects created for them (e.g. Istio ServiceAccounts and TLS Secrets). Returns number of failed deletions.
+        """
+        failed = self.cleanup.run()
+        with thread_pool(self.max_workers) as executor:
+            futures = [executor.submit(gateway.delete) for gateway in self.gateways]
+        for gateway, future in zip(self.gateways, futures):
+            if (error := future.exception()) is not None:
+                logger.warning("Deletion of Gateway %s failed: %s", gateway.name(), error)
+                failed += 1
+        self.gateways, self.routes, self.policies = [], [], []
+        return failed
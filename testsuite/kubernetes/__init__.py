@@ -1,22 +1,55 @@
 """Kubernetes common objects"""
 
+import contextlib
+import copy
 import dataclasses
 import functools
+import json
+import time
 from dataclasses import dataclass, field
-from typing import Optional, Literal
+from typing import Optional, Literal, Iterable
 
-from openshift_client import APIObject, timeout, OpenShiftPythonException
+import yaml
+import openshift_client as oc
+from openshift_client import APIObject, timeout, OpenShiftPythonException, Model, Missing
 
+from testsuite.kubernetes.api import API, KubernetesAPI, with_last_applied
+from testsuite.kubernetes.latency import RECONCILE_LATENCY
+from testsuite.kubernetes.watch import WATCHES, WatchFailed
 from testsuite.lifecycle import LifecycleObject
 from testsuite.utils import asdict
 
+FIELD_MANAGER = "kuadrant-testsuite"
+
+
+def merge_patch(original: dict, modified: dict) -> dict:
+    """Returns JSON merge patch (RFC 7386) which changes the original into the modified dict"""
+    patch: dict = {}
+    for key in original.keys() - modified.keys():
+        patch[key] = None
+    for key, value in modified.items():
+        if key not in original:
+            patch[key] = value
+        elif isinstance(value, dict) and isinstance(original[key], dict):
+            if nested := merge_patch(original[key], value):
+                patch[key] = nested
+        elif value != original[key]:
+            patch[key] = value
+    return patch
+
 
 class KubernetesObject(APIObject, LifecycleObject):
     """Custom APIObjects which tracks if the object was already committed to the server or not"""
 
+    # @modify sends changes of committed objects as merge patches instead of applying the whole objects
+    patch_modifications = True
+
     def __init__(self, dict_to_model=None, string_to_model=None, context=None):
         super().__init__(dict_to_model, string_to_model, context)
         self._committed = None
+        # Time of the last commit or modification and states reached since then, for reconcile latency
+        self._changed_at: float | None = None
+        self._reached: dict[str, float] = {}
 
     @property
     def committed(self):
@@ -25,20 +58,52 @@ class KubernetesObject(APIObject, LifecycleObject):
             self._committed, _ = self.exists()
         return self._committed
 
+    @property
+    def api(self) -> KubernetesAPI | None:
+        """Client for direct access to the Kubernetes API, None if the object is managed through oc"""
+        return API.for_context(self.context)
+
+    def _api_args(self) -> tuple[str, str, str, str | None]:
+        """Returns apiVersion, kind, name and namespace of this object for the Kubernetes API calls"""
+        return (
+            self.api_version(),
+            self.model.kind,
+            self.name(),
+            self.namespace(if_missing=None) or self.context.get_project(),
+        )
+
+    def exists(self, *args, **kwargs):
+        if (api := self.api) is None or args or kwargs:
+            return super().exists(*args, **kwargs)
+        return api.get(*self._api_args(), ignore_not_found=True) is not None, None
+
+    def refresh(self):
+        if (api := self.api) is None:
+            return super().refresh()
+        self.model = Model(api.get(*self._api_args()))
+        return self
+
     def commit(self):
         """
         Creates object on the server and returns created entity.
         It will be the same class but attributes might differ, due to server adding/rejecting some of them.
         If the object already exists (e.g. during a pytest rerun), it falls back to apply.
         """
+        api = self.api
+        self.mark_changed()
         try:
-            self.create(["--save-config=true"])
+            if api is None:
+                self.create(["--save-config=true"])
+            else:
+                self.model = Model(api.create(with_last_applied(self.as_dict()), self._api_args()[3]))
         except OpenShiftPythonException as e:
             if "AlreadyExists" in str(e):
                 self.apply()
             else:
                 raise
         self._committed = True
+        if api is not None:
+            return self
         return self.refresh()
 
     def apply(self, modifier_func=None, retries=2, **kwargs):  # pylint: disable=arguments-renamed
@@ -47,19 +112,120 @@ class KubernetesObject(APIObject, LifecycleObject):
         openshift_client library .apply() method is literally .modify_and_apply(), but with no modifier_func and
         retries set to 0.
         """
-        res, success = super().modify_and_apply(modifier_func or (lambda _: True), retries=retries, **kwargs)
+        res, success = self.modify_and_apply(modifier_func or (lambda _: True), retries=retries, **kwargs)
         assert success, f"Modify and apply returned non-zero exit code for {self.kind()}/{self.name()}: {res.err()}"
         return res
 
+    def modify_and_apply(self, modifier_func, retries=2, cmd_args=None, **kwargs):
+        """
+        Through the Kubernetes API the modified object replaces the stored one,
+        conflicts with concurrent changes are retried on a refreshed copy, like failed `oc apply` calls
+        """
+        self.mark_changed()
+        if (api := self.api) is None:
+            return super().modify_and_apply(modifier_func, retries=retries, cmd_args=cmd_args, **kwargs)
+        result = APIResult()
+        for attempt in reversed(range(retries + 1)):
+            if modifier_func(self, **kwargs) is False:
+                break
+            try:
+                if self.model.metadata.resourceVersion is Missing:
+                    # Object was not created through this instance (e.g. commit of existing object)
+                    live = api.get(*self._api_args())
+                    self.model.metadata.resourceVersion = live["metadata"]["resourceVersion"]
+                self.model = Model(api.replace(with_last_applied(self.as_dict()), self._api_args()[3]))
+                result.success = True
+                return result, True
+            except OpenShiftPythonException as e:
+                result.errors.append(str(e))
+                if attempt != 0:
+                    self.refresh()
+        return result, False
+
+    def modify_and_patch(self, modifier_func, retries=2):
+        """
+        Runs the modifier on a refreshed model and sends only its effect as a single JSON merge patch.
+        The patch carries the resourceVersion of the refreshed model, so concurrent changes (e.g. of lists,
+        which merge patches replace as a whole) fail with a conflict and are retried on a refreshed copy,
+        like in modify_and_apply().
+        """
+        result = APIResult()
+        for _ in range(retries + 1):
+            self.refresh()
+            original = copy.deepcopy(self.as_dict())
+            modifier_func(self)
+            patch = merge_patch(original, self.as_dict())
+            patch.pop("status", None)
+            if not patch:
+                result.success = True
+                return result, True
+            self.mark_changed()
+            patch.setdefault("metadata", {})["resourceVersion"] = original["metadata"]["resourceVersion"]
+            try:
+                self.model = Model(self._patch(patch))
+                result.success = True
+                return result, True
+            except OpenShiftPythonException as e:
+                result.errors.append(str(e))
+        return result, False
+
+    def _patch(self, patch: dict) -> dict:
+        """Sends the JSON merge patch and returns the patched object"""
+        api_version, kind, name, namespace = self._api_args()
+        if (api := self.api) is not None:
+            return api.patch(api_version, kind, name, patch, namespace, params={"fieldManager": FIELD_MANAGER})
+        with self.context:
+            result = oc.invoke(
+                "patch",
+                [self.qname(), "--type=merge", f"--patch={json.dumps(patch)}", f"--field-manager={FIELD_MANAGER}"]
+                + ["-o=json"],
+            )
+        return json.loads(result.out())
+
+    def mark_changed(self):
+        """Marks the object as changed on the server, it starts measuring its reconcile latency"""
+        self._changed_at = time.monotonic()
+        self._reached.clear()
+
+    def record_reconcile(self, state: str) -> float | None:
+        """
+        Records time from the last commit or modification of this object until it was first seen in the state.
+        Returns the time, None if the object wasn't committed through this instance.
+        """
+        if self._changed_at is None:
+            return None
+        if state not in self._reached:
+            self._reached[state] = seconds = time.monotonic() - self._changed_at
+            RECONCILE_LATENCY.record(self.model.kind, self.name(), state, seconds)
+        return self._reached[state]
+
     def delete(self, ignore_not_found=True, cmd_args=None):
         """Deletes the resource, by default ignored not found"""
+        if (api := self.api) is not None and cmd_args is None:
+            deleted = api.delete(*self._api_args(), ignore_not_found=ignore_not_found)
+            self._committed = False
+            return deleted
         with timeout(30):
             deleted = super().delete(ignore_not_found, cmd_args)
             self._committed = False
             return deleted
 
     def wait_until(self, test_function, timelimit=60):
-        """Waits until the test function succeeds for this object"""
+        """
+        Waits until the test function succeeds for this object.
+        If watches are enabled, the test function is evaluated on every change received through a watch shared
+        with other waiters, instead of polling the object. Falls back to polling if the watch can't be used.
+        """
+        if WATCHES.enabled:
+            try:
+                return self._watch_until(test_function, timelimit)
+            except WatchFailed:
+                pass
+        if (api := self.api) is not None:
+            obj = api.wait_until(*self._api_args(), lambda obj: test_function(self.__class__(obj)), timelimit=timelimit)
+            if obj is not None:
+                self.model = Model(obj)
+            return obj is not None
         try:
             with timeout(timelimit):
                 success, _, _ = self.self_selector().until_all(
@@ -72,6 +238,79 @@ class KubernetesObject(APIObject, LifecycleObject):
                 return False
             raise e
 
+    def _watch_until(self, test_function, timelimit):
+        """Waits until the test function succeeds for the latest state of this object received from the watch"""
+        stream = WATCHES.stream(self.context, self.qkind(), self.namespace(if_missing=None))
+        uid = self.model.metadata.uid
+
+        def _predicate(obj):
+            # Ignore previous incarnation of the object with the same name, which could still be in the stream
+            if uid is not Missing and obj["metadata"]["uid"] != uid:
+                return False
+            return test_function(self.__class__(obj))
+
+        obj = stream.wait(self.name(), _predicate, timelimit, WATCHES.resync)
+        if obj is None:
+            return False
+        self.model = Model(obj)
+        return True
+
+
+class APIResult:
+    """Result of modify_and_apply() through the Kubernetes API, compatible with the openshift_client Result"""
+
+    def __init__(self):
+        self.success = False
+        self.errors: list[str] = []
+
+    def status(self) -> int:
+        """Return code, 0 if the change was applied"""
+        return 0 if self.success else 1
+
+    def out(self) -> str:
+        """Standard output, there is none for API calls"""
+        return ""
+
+    def err(self) -> str:
+        """Errors of all attempts"""
+        return "\n".join(self.errors)
+
+
+def commit_all(objects: Iterable[KubernetesObject]) -> list[KubernetesObject]:
+    """
+    Commits multiple objects with a single `apply` of a multi-document stream and refreshes them with a single `get`
+    per cluster and namespace, instead of two oc invocations per object. Objects are applied in the given order.
+    Objects which override commit() (e.g. to create additional resources) are committed one by one.
+    Returns the committed objects.
+    """
+    objects = list(objects)
+    groups: dict[tuple, list[KubernetesObject]] = {}
+    for obj in objects:
+        # Objects managed through the Kubernetes API are created over a keep-alive connection, which is cheap
+        if type(obj).commit is not KubernetesObject.commit or obj.api is not None:
+            obj.commit()
+            continue
+        context = obj.context
+        # Objects may be in other namespace than the project of their context
+        namespace = obj.namespace(if_missing=None) or context.project_name
+        key = (context.api_server, context.token, context.kubeconfig_path, context.project_name, namespace)
+        groups.setdefault(key, []).append(obj)
+
+    for key, group in groups.items():
+        context = group[0].context
+        for obj in group:
+            obj.mark_changed()
+        # Cluster-scoped objects in a context without a project are refreshed without any namespace
+        namespace = oc.project(key[-1]) if key[-1] is not None else contextlib.nullcontext()
+        with context:
+            oc.invoke("apply", ["-f", "-"], stdin_str=yaml.safe_dump_all(obj.as_dict() for obj in group))
+            with namespace:
+                refreshed = {obj.qname(): obj for obj in oc.selector([obj.qname() for obj in group]).objects()}
+        for obj in group:
+            obj.model = refreshed[obj.qname()].model
+            obj._committed = True  # pylint: disable=protected-access
+    return objects
+
 
 class CustomResource(KubernetesObject):
     """Custom APIObjects that implements methods that improves manipulation with CR objects"""
@@ -95,7 +334,7 @@ class CustomResource(KubernetesObject):
 
 
 def modify(func):
-    """Wraps method of a subclass of KubernetesObject to use modify_and_apply when the object
+    """Wraps method of a subclass of KubernetesObject to use modify_and_patch (or modify_and_apply) when the object
     is already committed to the server, or run it normally if it isn't.
     All methods modifying the target object in any way should be decorated by this"""
 
@@ -110,6 +349,10 @@ def modify(func):
     @functools.wraps(func)
     def _wrap(self, *args, **kwargs):
         if self.committed:
+            if KubernetesObject.patch_modifications:
+                result, success = self.modify_and_patch(_custom_partial(func, *args, **kwargs))
+                assert success, f"Modify and patch failed: {result.err()}"
+                return
             result, _ = self.modify_and_apply(_custom_partial(func, *args, **kwargs))
             assert result.status
         else:
@@ -0,0 +1,287 @@
+"""
+Direct access to the Kubernetes API server over pooled keep-alive connections,
+an alternative to forking an oc/kubectl binary for every operation
+"""
+
+import base64
+import json
+import logging
+import ssl
+import threading
+import time
+
+import httpx
+import openshift_client as oc
+from openshift_client import Context, OpenShiftPythonException
+
+from testsuite.httpx import create_tmp_file
+
+logger = logging.getLogger(__name__)
+
+LAST_APPLIED = "kubectl.kubernetes.io/last-applied-configuration"
+
+
+def with_last_applied(obj: dict) -> dict:
+    """
+    Returns the object with the last-applied-configuration annotation, the same one `oc create --save-config` adds,
+    so that objects created or replaced through the API can be later modified by `oc apply` as well
+    """
+    obj = dict(obj)
+    metadata = dict(obj.get("metadata", {}))
+    annotations = dict(metadata.get("annotations", {}))
+    annotations.pop(LAST_APPLIED, None)
+    applied = {key: value for key, value in obj.items() if key != "status"}
+    applied["metadata"] = {
+        key: value
+        for key, value in metadata.items()
+        if key in ("name", "namespace", "labels", "annotations", "generateName", "ownerReferences", "finalizers")
+    }
+    if annotations:
+        applied["metadata"]["annotations"] = dict(annotations)
+    annotations[LAST_APPLIED] = json.dumps(applied, separators=(",", ":"), sort_keys=True)
+    metadata["annotations"] = annotations
+    obj["metadata"] = metadata
+    return obj
+
+
+class KubernetesAPI:
+    """Kubernetes API client for a single cluster and user, thread-safe"""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        server: str,
+        token: str = None,
+        ca_data: str = None,
+        insecure: bool = False,
+        client_cert: tuple[str, str] = None,
+        namespace: str = None,
+        timeout: float = 30,
+    ):
+        """
+        :param server: URL of the API server
+        :param token: Bearer token
+        :param ca_data: PEM encoded CA certificates of the API server, system CAs are used if None
+        :param insecure: Skip API server certificate verification
+        :param client_cert: PEM encoded client certificate and key
+        :param namespace: Namespace of the kubeconfig context, used when the namespace is not specified otherwise
+        :param timeout: Timeout of a single request in seconds
+        """
+        self.server = server
+        self.token = token
+        self.namespace = namespace or "default"
+        if insecure:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        else:
+            context = ssl.create_default_context(cadata=ca_data)
+        if client_cert is not None:
+            with create_tmp_file(client_cert[0]) as cert_file, create_tmp_file(client_cert[1]) as key_file:
+                context.load_cert_chain(cert_file.name, keyfile=key_file.name)
+        headers = {"Accept": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        self.client = httpx.Client(base_url=server, headers=headers, verify=context, timeout=timeout)
+        self._resources: dict[str, dict[str, tuple[str, bool]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_kubeconfig(cls, config: dict, server: str = None, token: str = None) -> "KubernetesAPI | None":
+        """
+        Creates client from a minified kubeconfig (`oc config view --minify --raw -o json`),
+        explicit server and token take precedence. Returns None if the kubeconfig uses unsupported authentication.
+        """
+        cluster = config["clusters"][0]["cluster"] if config.get("clusters") else {}
+        user = config["users"][0].get("user", {}) if config.get("users") else {}
+        context = config["contexts"][0].get("context", {}) if config.get("contexts") else {}
+        if token is None and ("exec" in user or "auth-provider" in user):
+            logger.info("Kubeconfig uses exec or auth-provider authentication, which is supported only by oc")
+            return None
+
+        if token is None:
+            token = user.get("token")
+            if token is None and "tokenFile" in user:
+                with open(user["tokenFile"], encoding="utf-8") as file:
+                    token = file.read().strip()
+        ca_data = _data(cluster, "certificate-authority")
+        client_cert = None
+        cert, key = _data(user, "client-certificate"), _data(user, "client-key")
+        if cert is not None and key is not None:
+            client_cert = (cert, key)
+        server = server or cluster.get("server")
+        if server is None:
+            raise ValueError("Kubeconfig does not contain API server URL")
+        insecure = cluster.get("insecure-skip-tls-verify", False)
+        if server.startswith("insecure://"):
+            server = "https://" + server[len("insecure://") :]
+            insecure = True
+        return cls(server, token, ca_data, insecure, client_cert, context.get("namespace"))
+
+    def resource(self, api_version: str, kind: str) -> tuple[str, bool]:
+        """Returns plural resource name and whether it is namespaced, discovered once per API group version"""
+        with self._lock:
+            if api_version not in self._resources:
+                prefix = "/api" if "/" not in api_version else "/apis"
+                resources = self.request("GET", f"{prefix}/{api_version}")["resources"]
+                self._resources[api_version] = {
+                    resource["kind"]: (resource["name"], resource["namespaced"])
+                    for resource in resources
+                    if "/" not in resource["name"]
+                }
+            try:
+                return self._resources[api_version][kind]
+            except KeyError as e:
+                raise OpenShiftPythonException(
+                    f"NotFound: the server doesn't have a resource type {kind} in {api_version}"
+                ) from e
+
+    def path(self, api_version: str, kind: str, namespace: str = None, name: str = None) -> str:
+        """Returns URL path of the resource collection, or of the named object"""
+        plural, namespaced = self.resource(api_version, kind)
+        path = "/api/" if "/" not in api_version else "/apis/"
+        path += api_version
+        if namespaced:
+            path += f"/namespaces/{namespace or self.namespace}"
+        path += f"/{plural}"
+        if name is not None:
+            path += f"/{name}"
+        return path
+
+    def request(self, method: str, path: str, **kwargs) -> dict:
+        """Sends the request and returns the decoded response, Kubernetes Status errors are raised as exceptions"""
+        try:
+            response = self.client.request(method, path, **kwargs)
+        except httpx.RequestError as e:
+            raise OpenShiftPythonException(f"{method} {path} failed: {e}") from e
+        body = response.json() if response.headers.get("Content-Type", "").startswith("application/json") else {}
+        if response.is_error:
+            raise OpenShiftPythonException(
+                f"{method} {path} failed with {response.status_code} "
+                f"{body.get('reason', response.reason_phrase)}: {body.get('message', response.text)}",
+                status_code=response.status_code,
+                reason=body.get("reason"),
+            )
+        return body
+
+    def get(self, api_version: str, kind: str, name: str, namespace: str = None, ignore_not_found=False) -> dict | None:
+        """Returns the object, None if it doesn't exist and `ignore_not_found` is set"""
+        try:
+            return self.request("GET", self.path(api_version, kind, namespace, name))
+        except OpenShiftPythonException as e:
+            if ignore_not_found and e.kwargs.get("status_code") == 404:
+                return None
+            raise
+
+    def list(self, api_version: str, kind: str, namespace: str = None, labels: dict[str, str] = None) -> list[dict]:
+        """Returns all objects of the kind, optionally filtered by labels"""
+        params = {}
+        if labels:
+            params["labelSelector"] = ",".join(f"{key}={value}" for key, value in labels.items())
+        result = self.request("GET", self.path(api_version, kind, namespace), params=params)
+        for item in result["items"]:
+            item.setdefault("apiVersion", api_version)
+            item.setdefault("kind", kind)
+        return result["items"]
+
+    def create(self, obj: dict, namespace: str = None) -> dict:
+        """Creates the object and returns it as stored by the server"""
+        namespace = obj["metadata"].get("namespace", namespace)
+        return self.request("POST", self.path(obj["apiVersion"], obj["kind"], namespace), json=obj)
+
+    def replace(self, obj: dict, namespace: str = None) -> dict:
+        """Replaces the object, it needs to contain current resourceVersion, returns the object as stored"""
+        namespace = obj["metadata"].get("namespace", namespace)
+        path = self.path(obj["apiVersion"], obj["kind"], namespace, obj["metadata"]["name"])
+        return self.request("PUT", path, json=obj)
+
+    # pylint: disable=too-many-arguments
+    def patch(
+        self,
+        api_version: str,
+        kind: str,
+        name: str,
+        patch: dict,
+        namespace: str = None,
+        content_type: str = "application/merge-patch+json",
+        params: dict = None,
+    ) -> dict:
+        """Patches the object and returns it as stored by the server"""
+        return self.request(
+            "PATCH",
+            self.path(api_version, kind, namespace, name),
+            content=json.dumps(patch),
+            headers={"Content-Type": content_type},
+            params=params,
+        )
+
+    def delete(self, api_version: str, kind: str, name: str, namespace: str = None, ignore_not_found=True) -> bool:
+        """Deletes the object, returns False if it did not exist"""
+        try:
+            self.request("DELETE", self.path(api_version, kind, namespace, name))
+            return True
+        except OpenShiftPythonException as e:
+            if ignore_not_found and e.kwargs.get("status_code") == 404:
+                return False
+            raise
+
+    def delete_collection(self, api_version: str, kind: str, label_selector: str, namespace: str = None):
+        """Deletes all objects of the kind matching the label selector with a single request"""
+        self.request("DELETE", self.path(api_version, kind, namespace), params={"labelSelector": label_selector})
+
+    def wait_until(self, api_version, kind, name, namespace, test_function, timelimit=60, interval=1) -> dict | None:
+        """Polls the object until the test function succeeds, returns the object or None on timeout"""
+        deadline = time.monotonic() + timelimit
+        while True:
+            obj = self.get(api_version, kind, name, namespace, ignore_not_found=True)
+            if obj is not None and test_function(obj):
+                return obj
+            if time.monotonic() + interval > deadline:
+                return None
+            time.sleep(interval)
+
+    def close(self):
+        """Closes the connection pool"""
+        self.client.close()
+
+
+def _data(section: dict, name: str) -> str | None:
+    """Returns PEM data of a kubeconfig field, which can be either inlined as base64 or a path to a file"""
+    if f"{name}-data" in section:
+        return base64.b64decode(section[f"{name}-data"]).decode("utf-8")
+    if name in section:
+        with open(section[name], encoding="utf-8") as file:
+            return file.read()
+    return None
+
+
+class KubernetesAPIRegistry:
+    """API clients shared by all objects using the same kubeconfig, server and token"""
+
+    def __init__(self):
+        self.enabled = False
+        self.clients: dict[tuple, KubernetesAPI | None] = {}
+        self.lock = threading.Lock()
+
+    def for_context(self, context: Context) -> KubernetesAPI | None:
+        """Returns API client for the context, None if the API transport is disabled or can't be used with it"""
+        if not self.enabled:
+            return None
+        key = (context.get_kubeconfig_path(), context.get_api_server(), context.get_token())
+        with self.lock:
+            if key not in self.clients:
+                # The only oc invocation, kubeconfig is resolved by oc once per cluster and user
+                with context:
+                    config = json.loads(oc.invoke("config", ["view", "--minify=true", "--raw=true", "-o=json"]).out())
+                self.clients[key] = KubernetesAPI.from_kubeconfig(config, context.get_api_server(), context.get_token())
+            return self.clients[key]
+
+    def close(self):
+        """Closes all API clients"""
+        with self.lock:
+            for client in self.clients.values():
+                if client is not None:
+                    client.close()
+            self.clients.clear()
+
+
+API = KubernetesAPIRegistry()
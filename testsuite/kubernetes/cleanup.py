@@ -0,0 +1,193 @@
+"""
+Label-scoped bulk cleanup, deletes everything labeled by a test run with a single `delete --selector` per kind,
+concurrently across all namespaces and clusters. Runs at the end of the session if `kubernetes.cleanup` is enabled
+and can be used standalone to remove leftovers of crashed runs:
+
+    python -m testsuite.kubernetes.cleanup [--prefix PREFIX] [LABEL ...]
+"""
+
+import argparse
+import json
+import logging
+import threading
+from itertools import product
+
+from openshift_client import OpenShiftPythonException
+
+from testsuite import thread_pool
+from testsuite.config import settings
+from testsuite.kubernetes.api import API
+from testsuite.kubernetes.client import KubernetesClient
+from testsuite.kubernetes.informer import qualified_kind
+
+logger = logging.getLogger(__name__)
+
+# Labels which the testsuite puts on the objects, their values are derived from the `label` fixture
+LABEL_KEYS = ("app", "testRun")
+
+# Namespaced kinds the testsuite creates, policies first so that their targets are deleted in the same pass
+KINDS = [
+    ("kuadrant.io/v1", "AuthPolicy"),
+    ("kuadrant.io/v1", "RateLimitPolicy"),
+    ("kuadrant.io/v1", "DNSPolicy"),
+    ("kuadrant.io/v1", "TLSPolicy"),
+    ("kuadrant.io/v1alpha1", "TokenRateLimitPolicy"),
+    ("kuadrant.io/v1alpha1", "DNSRecord"),
+    ("extensions.kuadrant.io/v1alpha1", "OIDCPolicy"),
+    ("extensions.kuadrant.io/v1alpha1", "PlanPolicy"),
+    ("extensions.kuadrant.io/v1alpha1", "TelemetryPolicy"),
+    ("authorino.kuadrant.io/v1beta3", "AuthConfig"),
+    ("operator.authorino.kuadrant.io/v1beta1", "Authorino"),
+    ("gateway.networking.k8s.io/v1", "HTTPRoute"),
+    ("gateway.networking.k8s.io/v1", "Gateway"),
+    ("networking.istio.io/v1", "ServiceEntry"),
+    ("networking.istio.io/v1", "DestinationRule"),
+    ("networking.istio.io/v1alpha3", "EnvoyFilter"),
+    ("route.openshift.io/v1", "Route"),
+    ("networking.k8s.io/v1", "Ingress"),
+    ("monitoring.coreos.com/v1", "ServiceMonitor"),
+    ("monitoring.coreos.com/v1", "PodMonitor"),
+    ("autoscaling/v2", "HorizontalPodAutoscaler"),
+    ("apps/v1", "Deployment"),
+    ("v1", "Service"),
+    ("v1", "ServiceAccount"),
+    ("v1", "ConfigMap"),
+    ("v1", "Secret"),
+]
+
+
+class LabelCleanup:
+    """Deletes objects of all KINDS labeled with any of the registered label values, in all registered namespaces"""
+
+    def __init__(self, kinds: list[tuple[str, str]] = None, keys=LABEL_KEYS, max_workers: int = 20):
+        self.kinds = kinds or KINDS
+        self.keys = keys
+        self.max_workers = max_workers
+        self.clients: dict[tuple, KubernetesClient] = {}
+        self.values: set[str] = set()
+        self.lock = threading.Lock()
+
+    def add_client(self, client: KubernetesClient):
+        """Registers namespace (and cluster) of the client"""
+        context = client.context
+        key = (context.api_server, context.token, context.kubeconfig_path, client.project)
+        with self.lock:
+            self.clients.setdefault(key, client)
+
+    def add_label(self, value: str):
+        """Registers label value, objects having it under any of the label keys will be deleted"""
+        with self.lock:
+            self.values.add(value)
+
+    def selectors(self) -> list[str]:
+        """Returns label selectors matching all registered label values, one per label key"""
+        values = ",".join(sorted(self.values))
+        return [f"{key} in ({values})" for key in self.keys]
+
+    def discover(self, prefix: str):
+        """Registers all label values starting with the prefix found on objects in the registered namespaces"""
+
+        def _discover(client, api_version, kind, key):
+            for obj in _list(client, api_version, kind, key):
+                value = obj["metadata"].get("labels", {}).get(key, "")
+                if value.startswith(prefix):
+                    self.add_label(value)
+
+        with thread_pool(self.max_workers) as executor:
+            for future in [
+                executor.submit(_discover, client, api_version, kind, key)
+                for client, (api_version, kind), key in product(self.clients.values(), self.kinds, self.keys)
+            ]:
+                future.result()
+
+    def run(self) -> int:
+        """Deletes all matching objects, returns number of failed deletions, which are logged"""
+        if not self.values:
+            return 0
+        with thread_pool(self.max_workers) as executor:
+            futures = [
+                executor.submit(_delete, client, api_version, kind, selector)
+                for client, (api_version, kind), selector in product(
+                    self.clients.values(), self.kinds, self.selectors()
+                )
+            ]
+            return sum(not future.result() for future in futures)
+
+
+def _missing_kind(error: str) -> bool:
+    """Returns True if the error says that the kind is not installed on the cluster"""
+    return "doesn't have a resource type" in error
+
+
+def _delete(client: KubernetesClient, api_version: str, kind: str, selector: str) -> bool:
+    """Deletes objects of the kind matching the selector, without waiting, returns False if it failed"""
+    error = None
+    if (api := client.api) is not None:
+        try:
+            api.delete_collection(api_version, kind, selector, client.project)
+        except OpenShiftPythonException as e:
+            error = str(e)
+    else:
+        result = client.do_action(
+            "delete",
+            qualified_kind(api_version, kind),
+            f"--selector={selector}",
+            "--ignore-not-found",
+            "--wait=false",
+            auto_raise=False,
+        )
+        if result.status() != 0:
+            error = result.err()
+    if error is not None and not _missing_kind(error):
+        logger.warning("Cleanup of %s in %s failed: %s", kind, client.project, error)
+        return False
+    return True
+
+
+def _list(client: KubernetesClient, api_version: str, kind: str, key: str) -> list[dict]:
+    """Returns objects of the kind which have the label key, nothing if the kind is not installed"""
+    if (api := client.api) is not None:
+        try:
+            path = api.path(api_version, kind, client.project)
+            return api.request("GET", path, params={"labelSelector": key})["items"]
+        except OpenShiftPythonException as e:
+            if _missing_kind(str(e)):
+                return []
+            raise
+    result = client.do_action(
+        "get", qualified_kind(api_version, kind), f"--selector={key}", "-o=json", auto_raise=False
+    )
+    if result.status() != 0:
+        if _missing_kind(result.err()):
+            return []
+        raise OpenShiftPythonException(f"Listing of {kind} in {client.project} failed: {result.err()}")
+    return json.loads(result.out())["items"]
+
+
+def main():
+    """Deletes objects labeled by the given test runs in all namespaces and clusters from the testsuite settings"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("labels", nargs="*", help="Label values to delete, e.g. label of a crashed test run")
+    parser.add_argument("--prefix", help="Delete all label values with the prefix, e.g. testrun-<user>")
+    args = parser.parse_args()
+    if not args.labels and not args.prefix:
+        parser.error("at least one label or --prefix is required")
+
+    API.enabled = settings["kubernetes"]["transport"] == "api"
+    cleanup = LabelCleanup()
+    namespaces = [settings["service_protection"][name] for name in ("project", "project2", "system_project")]
+    for cluster in [settings["control_plane"][name] for name in ("cluster", "cluster2", "cluster3")]:
+        if cluster:
+            for namespace in namespaces:
+                cleanup.add_client(cluster.change_project(namespace))
+    for value in args.labels:
+        cleanup.add_label(value)
+    if args.prefix:
+        cleanup.discover(args.prefix)
+    logger.info("Deleting objects labeled with %s", ", ".join(sorted(cleanup.values)) or "nothing")
+    raise SystemExit(1 if cleanup.run() else 0)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
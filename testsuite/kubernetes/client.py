@@ -3,17 +3,25 @@
 from functools import cached_property
 from urllib.parse import urlparse
 import tempfile
+import threading
 import yaml
 
 import openshift_client as oc
 from openshift_client import Context, OpenShiftPythonException
 
+from testsuite.kubernetes.api import API, KubernetesAPI
 from testsuite.kubernetes.openshift.route import OpenshiftRoute
 from testsuite.kubernetes.service import Service
 from .service_account import ServiceAccount
 from .deployment import Deployment
 from .secret import Secret
 
+# Clients shared by the whole session, keyed by (api_url, token, kubeconfig_path, project)
+_CLIENTS: dict[tuple, "KubernetesClient"] = {}
+# Values resolved from kubeconfig, keyed by (api_url, token, kubeconfig_path), as they don't depend on the project
+_RESOLVED: dict[tuple, dict[str, str]] = {}
+_LOCK = threading.Lock()
+
 
 class KubernetesClient:
     """KubernetesClient is a helper class for invoking kubectl commands"""
@@ -26,14 +34,38 @@ class KubernetesClient:
         self._token = token
         self._kubeconfig_path = kubeconfig_path
 
+    @classmethod
+    def interned(
+        cls, project: str = None, api_url: str = None, token: str = None, kubeconfig_path: str = None
+    ) -> "KubernetesClient":
+        """Returns client shared by all callers with the same arguments, so that its context is created only once"""
+        key = (api_url, token, kubeconfig_path, project)
+        with _LOCK:
+            if key not in _CLIENTS:
+                _CLIENTS[key] = cls(project, api_url, token, kubeconfig_path)
+            return _CLIENTS[key]
+
     @classmethod
     def from_context(cls, context: Context) -> "KubernetesClient":
-        """Creates self from the context"""
-        return cls(context.get_project(), context.get_api_url(), context.get_token(), context.get_kubeconfig_path())
+        """Returns client for the context"""
+        return cls.interned(
+            context.get_project(), context.get_api_url(), context.get_token(), context.get_kubeconfig_path()
+        )
 
     def change_project(self, project) -> "KubernetesClient":
-        """Return new self with a different project"""
-        return KubernetesClient(project, self._api_url, self._token, self._kubeconfig_path)
+        """Return self with a different project"""
+        return self.interned(project, self._api_url, self._token, self._kubeconfig_path)
+
+    def _resolve(self, name: str, resolver):
+        """Returns value resolved from kubeconfig, it is resolved only once per cluster and user for the session"""
+        key = (self._api_url, self._token, self._kubeconfig_path)
+        with _LOCK:
+            resolved = _RESOLVED.setdefault(key, {})
+            if name in resolved:
+                return resolved[name]
+        value = resolver()
+        with _LOCK:
+            return resolved.setdefault(name, value)
 
     @cached_property
     def context(self):
@@ -47,6 +79,15 @@ class KubernetesClient:
 
         return context
 
+    @property
+    def api(self) -> KubernetesAPI | None:
+        """Client for direct access to the Kubernetes API, None if the cluster is accessed through oc"""
+        return API.for_context(self.context)
+
+    def _get_object(self, api: KubernetesAPI, api_version: str, kind: str, name: str, cls):
+        """Returns the object of the kind by the name through the Kubernetes API, wrapped in the class"""
+        return cls(api.get(api_version, kind, name, self.project), context=self.context)
+
     @property
     def current_context_name(self) -> str:
         """Returns the current context name from the kubeconfig"""
@@ -62,15 +103,25 @@ class KubernetesClient:
     @property
     def api_url(self):
         """Returns real API url"""
-        return self._api_url or self.inspect_context(jsonpath="{.clusters[*].cluster.server}")
+        if self._api_url is not None:
+            return self._api_url
+        if (api := self.api) is not None:
+            return api.server
+        return self._resolve("api_url", lambda: self.inspect_context(jsonpath="{.clusters[*].cluster.server}"))
 
     @property
     def token(self):
         """Returns real Kubernetes token"""
-        return self._token or self.inspect_context(jsonpath="{.users[*].user.token}", raw=True)
+        if self._token is not None:
+            return self._token
+        if (api := self.api) is not None and api.token is not None:
+            return api.token
+        return self._resolve("token", lambda: self.inspect_context(jsonpath="{.users[*].user.token}", raw=True))
 
     def get_service_account(self, name: str):
         """Select service account by the name and return testsuite ServiceAccount object wrapping it"""
+        if (api := self.api) is not None:
+            return self._get_object(api, "v1", "ServiceAccount", name, ServiceAccount)
         with self.context:
             return oc.selector(f"sa/{name}").object(cls=ServiceAccount)
 
@@ -87,14 +138,24 @@ class KubernetesClient:
 
     @property
     def project(self):
-        """Returns real Kubernetes namespace name"""
-        with self.context:
-            return oc.get_project_name()
+        """Returns real Kubernetes namespace name, the one from kubeconfig is resolved only once"""
+        if self._project is not None:
+            return self._project
+        if (api := self.api) is not None:
+            return api.namespace
+
+        def _project():
+            with self.context:
+                return oc.get_project_name()
+
+        return self._resolve("project", _project)
 
     @property
     def connected(self):
         """Returns True, if user is logged in and the project exists"""
         try:
+            if (api := self.api) is not None:
+                return api.get("v1", "Namespace", self.project, ignore_not_found=True) is not None
             self.do_action("get", "ns", self._project)
         except OpenShiftPythonException:
             return False
@@ -102,31 +163,48 @@ class KubernetesClient:
 
     def get_secret(self, name):
         """Returns dict-like structure for accessing secret data"""
+        if (api := self.api) is not None:
+            return self._get_object(api, "v1", "Secret", name, Secret)
         with self.context:
             return oc.selector(f"secret/{name}").object(cls=Secret)
 
     def service_exists(self, name) -> bool:
         """Returns True if service with the given name exists"""
+        if (api := self.api) is not None:
+            return api.get("v1", "Service", name, self.project, ignore_not_found=True) is not None
         with self.context:
             return oc.selector(f"svc/{name}").count_existing() == 1
 
     def get_route(self, name):
         """Returns dict-like structure for accessing secret data"""
+        if (api := self.api) is not None:
+            return self._get_object(api, "route.openshift.io/v1", "Route", name, OpenshiftRoute)
         with self.context:
             return oc.selector(f"route/{name}").object(cls=OpenshiftRoute)
 
     def get_routes_for_service(self, service_name: str) -> list[OpenshiftRoute]:
         """Returns list of routes for given service"""
+        if (api := self.api) is not None:
+            routes = api.list("route.openshift.io/v1", "Route", self.project)
+            return [
+                OpenshiftRoute(route, context=self.context)
+                for route in routes
+                if route["spec"]["to"]["name"] == service_name
+            ]
         with self.context:
             return oc.selector("route", field_selectors={"spec.to.name": service_name}).objects(cls=OpenshiftRoute)
 
     def get_service(self, service_name: str):
         """Returns dict-like structure for accessing service data"""
+        if (api := self.api) is not None:
+            return self._get_object(api, "v1", "Service", service_name, Service)
         with self.context:
             return oc.selector(f"service/{service_name}").object(cls=Service)
 
     def get_deployment(self, name: str):
         """Returns dict-like structure for accessing deployment data"""
+        if (api := self.api) is not None:
+            return self._get_object(api, "apps/v1", "Deployment", name, Deployment)
         with self.context:
             return oc.selector(f"deployment/{name}").object(cls=Deployment)
 
@@ -148,6 +226,8 @@ class KubernetesClient:
     @property
     def project_exists(self):
         """Returns True if the project exists"""
+        if (api := self.api) is not None:
+            return api.get("v1", "Namespace", self.project, ignore_not_found=True) is not None
         try:
             self.do_action("get", f"project/{self.project}")
             return True
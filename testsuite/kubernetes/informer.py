@@ -0,0 +1,136 @@
+"""
+Informer-like read cache, objects of a kind in a namespace are listed once and then read from memory.
+Lists are kept up to date by the shared watch streams if they are enabled and listed again only when
+a watch restarts. Without watches they are listed again once they get older than the staleness bound.
+Objects are also indexed by UIDs of their owners.
+"""
+
+import copy
+import threading
+import time
+from typing import Callable
+
+import openshift_client as oc
+from openshift_client import Context, OpenShiftPythonException
+
+from testsuite.kubernetes.api import API
+from testsuite.kubernetes.watch import WATCHES, WatchFailed, WatchStream
+
+# Returns objects owned by the object with the given UID
+OwnerIndex = Callable[[str], list[dict]]
+
+
+class Informer:
+    """Read cache of listed objects per kind and namespace"""
+
+    def __init__(self, max_age: float = 5):
+        """:param max_age: Maximum age of a list in seconds, before it is listed from the cluster again"""
+        self.max_age = max_age
+        self.lists: dict[tuple, tuple[float | None, list[dict], dict[str, list[dict]], int]] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _list(context: Context, api_version: str, kind: str) -> list[dict]:
+        """Lists all objects of the kind in the namespace of the context from the cluster"""
+        if (api := API.for_context(context)) is not None:
+            return api.list(api_version, kind, context.get_project())
+        return [
+            obj.as_dict() for obj in oc.selector(qualified_kind(api_version, kind), static_context=context).objects()
+        ]
+
+    @staticmethod
+    def _stream(context: Context, api_version: str, kind: str) -> WatchStream | None:
+        """Returns watch stream of the kind, None if watches are not available"""
+        if not WATCHES.enabled:
+            return None
+        try:
+            return WATCHES.stream(context, qualified_kind(api_version, kind), context.get_project())
+        except WatchFailed:
+            return None
+
+    def _current(
+        self, context: Context, api_version: str, kind: str, fresh: bool = False
+    ) -> tuple[list[dict], OwnerIndex]:
+        """
+        Returns up-to-date objects of the kind and their owner index, listing them from the cluster if needed.
+        With a live watch they are listed only once and again after every restart of the watch,
+        as a restarted watch sends all objects again and until it does, the stream is completed by a new list.
+        """
+        key = (*WATCHES.command(context, qualified_kind(api_version, kind), context.get_project()), api_version)
+        stream = self._stream(context, api_version, kind)
+        starts = stream.starts if stream is not None else 0
+        with self.lock:
+            listed_at, items, index, listed_starts = self.lists.get(key, (None, [], {}, 0))
+        if stream is not None:
+            stale = starts != listed_starts
+        else:
+            stale = listed_at is None or time.monotonic() - listed_at > self.max_age
+        if fresh or listed_at is None or stale:
+            items = self._list(context, api_version, kind)
+            index = _owner_index(items)
+            with self.lock:
+                self.lists[key] = (time.monotonic(), items, index, starts)
+            if stream is not None:
+                stream.seed(items)
+        if stream is not None:
+            return stream.snapshot(), stream.owned
+        return items, lambda uid: index.get(uid, [])
+
+    def owned(self, context: Context, api_version: str, kind: str, owner_uid: str) -> list[dict]:
+        """Returns copies of all objects of the kind in the namespace of the context owned by the object with the UID"""
+        _, index = self._current(context, api_version, kind)
+        return [copy.deepcopy(obj) for obj in index(owner_uid)]
+
+    def list(
+        self,
+        context: Context,
+        api_version: str,
+        kind: str,
+        labels: dict[str, str] = None,
+        name_contains: tuple[str, ...] = (),
+        fresh: bool = False,
+    ) -> list[dict]:
+        """
+        Returns copies of all objects of the kind in the namespace of the context, optionally filtered by labels
+        and by substrings which all need to be in the name.
+        :param fresh: Lists the objects from the cluster even if they were listed recently,
+        e.g. to be sure to see objects which controllers created just now
+        """
+        items, _ = self._current(context, api_version, kind, fresh)
+        return [
+            copy.deepcopy(obj)
+            for obj in items
+            if all(obj["metadata"].get("labels", {}).get(key) == value for key, value in (labels or {}).items())
+            and all(part in obj["metadata"]["name"] for part in name_contains)
+        ]
+
+    def object(self, context: Context, api_version: str, kind: str, labels: dict[str, str] = None, cls=None):
+        """Returns the only object of the kind in the namespace matching the labels, wrapped in the class"""
+        objects = self.list(context, api_version, kind, labels)
+        if len(objects) != 1:
+            raise OpenShiftPythonException(f"Expected a single {kind} with labels {labels}, but found {len(objects)}")
+        return (cls or oc.APIObject)(objects[0], context=context)
+
+    def invalidate(self):
+        """Drops all lists, next reads will list the objects from the cluster again"""
+        with self.lock:
+            self.lists.clear()
+
+
+def _owner_index(objects: list[dict]) -> dict[str, list[dict]]:
+    """Returns objects by UIDs of their owners"""
+    index: dict[str, list[dict]] = {}
+    for obj in objects:
+        for owner in obj["metadata"].get("ownerReferences", []):
+            index.setdefault(owner["uid"], []).append(obj)
+    return index
+
+
+def qualified_kind(api_version: str, kind: str) -> str:
+    """Returns kind qualified by the API group, as used by oc"""
+    if "/" not in api_version:
+        return kind.lower()
+    return f"{kind.lower()}.{api_version.split('/')[0]}"
+
+
+INFORMER = Informer()
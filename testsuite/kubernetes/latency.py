@@ -0,0 +1,70 @@
+"""
+Reconcile latency, time from a commit (or a modification) of an object until a wait for it to reach a state
+(e.g. Accepted or Enforced) succeeds. Every test run measures how fast the control plane reconciles.
+"""
+
+import csv
+import json
+import statistics
+import threading
+
+FIELDS = ("kind", "name", "state", "seconds")
+
+
+class ReconcileLatency:
+    """Thread-safe record of reconcile latencies"""
+
+    def __init__(self):
+        self.records: list[dict] = []
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, name: str, state: str, seconds: float):
+        """Records that the object reached the state `seconds` after it was committed or modified"""
+        with self._lock:
+            self.records.append({"kind": kind, "name": name, "state": state, "seconds": seconds})
+
+    def drain(self) -> list[dict]:
+        """Returns records since the previous drain"""
+        with self._lock:
+            records, self.records = self.records, []
+        return records
+
+
+RECONCILE_LATENCY = ReconcileLatency()
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    """Returns nearest-rank percentile of sorted values"""
+    return values[max(0, -(-len(values) * percent // 100) - 1)]
+
+
+def summarize(records: list[dict]) -> list[dict]:
+    """Returns count, mean, median, 95th percentile and maximum of latencies per kind and state"""
+    groups: dict[tuple[str, str], list[float]] = {}
+    for record in records:
+        groups.setdefault((record["kind"], record["state"]), []).append(record["seconds"])
+    summary = []
+    for (kind, state), values in sorted(groups.items()):
+        values.sort()
+        summary.append(
+            {
+                "kind": kind,
+                "state": state,
+                "count": len(values),
+                "mean": statistics.fmean(values),
+                "p50": _percentile(values, 50),
+                "p95": _percentile(values, 95),
+                "max": values[-1],
+            }
+        )
+    return summary
+
+
+def write_report(records: list[dict], prefix: str):
+    """Writes all records and their summary to `prefix`.json and the records to `prefix`.csv"""
+    with open(f"{prefix}.json", "w", encoding="utf-8") as file:
+        json.dump({"summary": summarize(records), "records": records}, file, indent=2)
+    with open(f"{prefix}.csv", "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
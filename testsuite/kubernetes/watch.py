@@ -0,0 +1,252 @@
+"""
+Watch-based waiting, a single `oc get --watch` stream per kind and namespace is shared by all waiters in the process,
+so waiting for an object does not spawn a new `oc get` every second
+"""
+
+import json
+import logging
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Callable
+
+from openshift_client import Context
+
+from testsuite import OC_PATH
+
+logger = logging.getLogger(__name__)
+
+
+class WatchFailed(Exception):
+    """Watch stream could not be (re)started, waiters should fall back to polling"""
+
+
+class WatchStream:
+    """Latest state of all objects of a single kind in a single namespace, kept up to date by `oc get --watch`"""
+
+    # pylint: disable=too-many-instance-attributes
+
+    # Stream is considered broken if oc exits this many times in a row without sending any event
+    MAX_FAILED_STARTS = 3
+
+    def __init__(self, command: list[str], description: str):
+        self.command = command
+        self.description = description
+        self.objects: dict[str, dict] = {}
+        # resourceVersions of deleted objects by their names, so that older lists don't bring them back
+        self.deleted: dict[str, int | None] = {}
+        # Names of the objects owned by an object, by its UID
+        self.children: dict[str, set[str]] = {}
+        self.failed = False
+        self.closed = False
+        self.condition = threading.Condition()
+        self.process: subprocess.Popen | None = None
+        # Number of started watch processes, objects listed before the last start may be outdated
+        self.starts = 0
+        threading.Thread(target=self._run, daemon=True, name=f"watch {description}").start()
+
+    def _run(self):
+        failed_starts = 0
+        while not self.closed and failed_starts < self.MAX_FAILED_STARTS:
+            received = False
+            if self.starts:
+                self._reset()
+            self.starts += 1
+            try:
+                # stderr goes to a file, an unread pipe would block chatty oc once it gets full
+                with tempfile.TemporaryFile("w+") as stderr:
+                    # pylint: disable=consider-using-with
+                    self.process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=stderr, text=True)
+                    for event in self._events(self.process.stdout):
+                        received = True
+                        self._handle(event)
+                    self.process.wait()
+                    if not received:
+                        stderr.seek(0)
+                        logger.debug("Watch of %s ended: %s", self.description, stderr.read().strip())
+            except OSError as e:
+                logger.debug("Watch of %s could not be started: %s", self.description, e)
+            failed_starts = 0 if received else failed_starts + 1
+            if not self.closed and failed_starts:
+                time.sleep(1)
+
+        with self.condition:
+            self.failed = True
+            self.condition.notify_all()
+
+    @staticmethod
+    def _events(stream):
+        """Parses concatenated pretty-printed JSON documents, each of them ends with a closing brace on its own line"""
+        lines: list[str] = []
+        for line in stream:
+            lines.append(line)
+            if line.rstrip() == "}":
+                yield json.loads("".join(lines))
+                lines = []
+
+    def _reset(self):
+        """
+        Drops all objects before the watch is started again, deletions missed while it was not running would
+        never be received. The new watch sends all existing objects again.
+        """
+        with self.condition:
+            self.objects.clear()
+            self.children.clear()
+            self.deleted.clear()
+            self.condition.notify_all()
+
+    def _handle(self, event: dict):
+        obj = event["object"]
+        name = obj["metadata"]["name"]
+        with self.condition:
+            self._remove(name)
+            if event["type"] == "DELETED":
+                self.deleted[name] = _version(obj)
+            else:
+                self.deleted.pop(name, None)
+                self._add(obj)
+            self.condition.notify_all()
+
+    def _add(self, obj: dict):
+        """Stores the object and indexes it by its owners, the condition lock has to be held"""
+        name = obj["metadata"]["name"]
+        self.objects[name] = obj
+        for owner in obj["metadata"].get("ownerReferences", []):
+            self.children.setdefault(owner["uid"], set()).add(name)
+
+    def _remove(self, name: str):
+        """Removes the object and its index entries, the condition lock has to be held"""
+        obj = self.objects.pop(name, None)
+        if obj is None:
+            return
+        for owner in obj["metadata"].get("ownerReferences", []):
+            names = self.children.get(owner["uid"], set())
+            names.discard(name)
+            if not names:
+                self.children.pop(owner["uid"], None)
+
+    def seed(self, objects: list[dict]):
+        """
+        Merges listed objects into the stream, the list may be older than events already received through the watch.
+        Listed object is taken only if it is newer than the received one, and if it wasn't deleted since it was listed.
+        """
+        with self.condition:
+            listed = set()
+            for obj in objects:
+                name = obj["metadata"]["name"]
+                listed.add(name)
+                version = _version(obj)
+                if name in self.deleted:
+                    if version is None or (self.deleted[name] or 0) >= version:
+                        continue
+                    del self.deleted[name]
+                if name in self.objects:
+                    current = _version(self.objects[name])
+                    if version is None or current is None or current >= version:
+                        continue
+                    self._remove(name)
+                self._add(obj)
+            # Deletions of objects which are no longer listed can't be undone by a later list
+            for name in set(self.deleted) - listed:
+                del self.deleted[name]
+            self.condition.notify_all()
+
+    def owned(self, uid: str) -> list[dict]:
+        """Returns the latest state of all objects owned by the object with the UID"""
+        with self.condition:
+            return [self.objects[name] for name in self.children.get(uid, ())]
+
+    def snapshot(self) -> list[dict]:
+        """Returns the latest state of all objects"""
+        with self.condition:
+            return list(self.objects.values())
+
+    def wait(self, name: str, predicate: Callable[[dict], bool], timelimit: float, resync: float) -> dict | None:
+        """
+        Waits until the predicate succeeds for the named object and returns the object, None on timeout.
+        Predicate is evaluated (outside of the lock) on every change of the object,
+        and at least every `resync` seconds for predicates that depend on other objects as well.
+        """
+        deadline = time.monotonic() + timelimit
+        last = None
+        while True:
+            with self.condition:
+                self.condition.wait_for(
+                    lambda: self.objects.get(name) is not last or self.failed,
+                    timeout=max(min(deadline - time.monotonic(), resync), 0),
+                )
+                if self.failed:
+                    raise WatchFailed(f"Watch of {self.description} is not running")
+                current = self.objects.get(name)
+            last = current
+            if current is not None and predicate(current):
+                return current
+            if time.monotonic() >= deadline:
+                return None
+
+    def close(self):
+        """Stops the watch"""
+        self.closed = True
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+
+
+def _version(obj: dict) -> int | None:
+    """Returns resourceVersion of the object as a number, None if it isn't one"""
+    try:
+        return int(obj["metadata"]["resourceVersion"])
+    except (KeyError, ValueError):
+        return None
+
+
+class WatchRegistry:
+    """Shares watch streams among all waiters in the process"""
+
+    def __init__(self, resync: float = 5, oc_path: str = OC_PATH):
+        """:param oc_path: Binary of the watches, the default of openshift_client is different in every thread"""
+        self.enabled = False
+        self.resync = resync
+        self.oc_path = oc_path
+        self.streams: dict[tuple, WatchStream] = {}
+        self.lock = threading.Lock()
+
+    def command(self, context: Context, kind: str, namespace: str | None) -> list[str]:
+        """Returns oc command watching `kind` objects with the same connection arguments as openshift_client uses"""
+        command = [self.oc_path]
+        if context.get_kubeconfig_path() is not None:
+            command.append(f"--kubeconfig={context.get_kubeconfig_path()}")
+        if (url := context.get_api_server()) is not None:
+            if url.startswith("insecure://"):
+                url = "https://" + url[len("insecure://") :]
+                command.append("--insecure-skip-tls-verify")
+            command.append(f"--server={url}")
+        if context.get_token() is not None:
+            command.append(f"--token={context.get_token()}")
+        if context.get_ca_cert_path() is not None:
+            command.append(f"--certificate-authority={context.get_ca_cert_path()}")
+        if namespace is not None:
+            command.append(f"--namespace={namespace}")
+        return command + ["get", kind, "--watch", "--output-watch-events", "-o", "json"]
+
+    def stream(self, context: Context, kind: str, namespace: str | None) -> WatchStream:
+        """Returns running watch stream for the kind in the namespace, starting it if needed"""
+        command = self.command(context, kind, namespace)
+        key = tuple(command)
+        with self.lock:
+            if key not in self.streams:
+                self.streams[key] = WatchStream(command, f"{kind} in {namespace or 'cluster'}")
+            stream = self.streams[key]
+        if stream.failed:
+            raise WatchFailed(f"Watch of {stream.description} is not running")
+        return stream
+
+    def close(self):
+        """Stops all watches"""
+        with self.lock:
+            for stream in self.streams.values():
+                stream.close()
+            self.streams.clear()
+
+
+WATCHES = WatchRegistry()
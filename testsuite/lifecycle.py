@@ -1,6 +1,14 @@
 """Classes related to lifecycle management"""
 
 import abc
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Callable, Iterable
+
+from testsuite import thread_pool
+
+logger = logging.getLogger(__name__)
 
 
 class LifecycleObject(abc.ABC):
@@ -15,3 +23,144 @@ class LifecycleObject(abc.ABC):
     def delete(self):
         """Removes resource,
         if there is some reconciliation needed, the method should wait until it is all reconciled"""
+
+
+def references(obj) -> set[tuple[str, str]]:
+    """
+    Returns (kind, name) of objects the object depends on, i.e. its targets, parents and owners,
+    which can be deleted only after the object itself
+    """
+    model = getattr(obj, "model", None)
+    if model is None:
+        return set()
+    spec = model.get("spec") or {}
+    refs = []
+    if spec.get("targetRef"):
+        refs.append(spec["targetRef"])
+    refs.extend(spec.get("targetRefs") or [])
+    refs.extend(spec.get("parentRefs") or [])
+    refs.extend((model.get("metadata") or {}).get("ownerReferences") or [])
+    return {(ref.get("kind", "Gateway").lower(), ref["name"]) for ref in refs}
+
+
+class TeardownScheduler:
+    """
+    Collects deletions of LifecycleObjects and runs them all at once, so that teardown takes only as long as
+    the slowest chain of dependent deletions. Objects are deleted before the objects they reference
+    (policies before routes before gateways), independent objects are deleted concurrently.
+    """
+
+    def __init__(self, max_workers: int = 10):
+        self.max_workers = max_workers
+        self.deletions: list[tuple[LifecycleObject, Callable[[], Any]]] = []
+
+    def add(self, obj: LifecycleObject, delete: Callable[[], Any] = None):
+        """Schedules deletion of the object, by its delete() method if no other `delete` function is given"""
+        self.deletions.append((obj, delete or obj.delete))
+
+    def run(self):
+        """Runs all scheduled deletions, in the order of their dependencies, raises the first error at the end"""
+        deletions, self.deletions = self.deletions, []
+        referrers, referenced = _dependencies([obj for obj, _ in deletions])
+
+        errors: list[Exception] = []
+        with thread_pool(self.max_workers) as executor:
+            pending = {executor.submit(deletions[i][1]): i for i, count in enumerate(referrers) if count == 0}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    if (error := future.exception()) is not None:
+                        logger.error("Deletion of %s failed: %s", _describe(deletions[index][0]), error)
+                        errors.append(error)
+                    for i in referenced[index]:
+                        referrers[i] -= 1
+                        if referrers[i] == 0:
+                            pending[executor.submit(deletions[i][1])] = i
+            # Objects in a reference cycle are deleted last, all at once
+            for future in [executor.submit(deletions[i][1]) for i, count in enumerate(referrers) if count > 0]:
+                if (error := future.exception()) is not None:
+                    errors.append(error)
+        if errors:
+            raise errors[0]
+
+
+class ReadinessBarrier:
+    """
+    Waits until all added objects are ready at once, so that the waits don't add up.
+    With watches enabled all waits for the objects of the same kind share a single watch stream.
+    """
+
+    def __init__(self, objects: Iterable[LifecycleObject] = (), max_workers: int = 10):
+        """:param objects: Objects which are ready when their wait_for_ready() returns"""
+        self.max_workers = max_workers
+        self.waits: list[tuple[LifecycleObject, Callable[[], Any]]] = []
+        for obj in objects:
+            self.add(obj)
+
+    def add(self, obj: LifecycleObject, predicate: Callable[[Any], bool] = None, timelimit: float = 60):
+        """
+        Adds object, which is ready when the predicate (e.g. has_condition()) succeeds for it,
+        or when its wait_for_ready() returns if there is no predicate
+        """
+        if predicate is None:
+            self.waits.append((obj, obj.wait_for_ready))  # type: ignore[attr-defined]
+            return
+
+        def _wait():
+            assert obj.wait_until(predicate, timelimit=timelimit), f"{_describe(obj)} did not get ready in time"
+
+        self.waits.append((obj, _wait))
+
+    def wait(self) -> list[tuple[LifecycleObject, float]]:
+        """
+        Waits until all objects are ready and returns time-to-ready of each of them in seconds.
+        If any of them doesn't get ready, the first error is raised once all the waits are finished.
+        """
+        start = time.monotonic()
+
+        def _timed(wait_func):
+            wait_func()
+            return time.monotonic() - start
+
+        with thread_pool(self.max_workers) as executor:
+            futures = [(obj, executor.submit(_timed, wait_func)) for obj, wait_func in self.waits]
+        errors = [error for _, future in futures if (error := future.exception()) is not None]
+        if errors:
+            raise errors[0]
+        timings = [(obj, future.result()) for obj, future in futures]
+        for obj, seconds in timings:
+            logger.info("%s got ready in %.1fs", _describe(obj), seconds)
+        return timings
+
+
+def _dependencies(objects: list) -> tuple[list[int], list[list[int]]]:
+    """
+    Returns number of objects referencing each object
+    and indices of the objects referenced by each object, which can be deleted only after it
+    """
+    keys = [_key(obj) for obj in objects]
+    referrers = [0] * len(objects)
+    referenced = []
+    for obj in objects:
+        refs = references(obj)
+        indices = [i for i, key in enumerate(keys) if key is not None and key in refs]
+        for i in indices:
+            referrers[i] += 1
+        referenced.append(indices)
+    return referrers, referenced
+
+
+def _key(obj) -> tuple[str, str] | None:
+    """Returns (kind, name) of the object as used by references to it, None for non-Kubernetes objects"""
+    model = getattr(obj, "model", None)
+    if model is None or not model.get("kind") or not (model.get("metadata") or {}).get("name"):
+        return None
+    return model["kind"].lower(), model["metadata"]["name"]
+
+
+def _describe(obj) -> str:
+    """Returns kind/name of the object for logs, or its class name for non-Kubernetes objects"""
+    if (key := _key(obj)) is not None:
+        return "/".join(key)
+    return type(obj).__name__
@@ -2,6 +2,7 @@
 
 import operator
 import signal
+from collections import Counter
 from urllib.parse import urlparse
 
 import yaml
@@ -15,7 +16,7 @@ from testsuite.capabilities import has_kuadrant, kuadrant_version
 from testsuite.certificates import CFSSLClient
 from testsuite.config import settings
 from testsuite.gateway import Exposer, CustomReference
-from testsuite.httpx import KuadrantClient
+from testsuite.httpx import KuadrantClient, SESSION_RETRY_STATS, TRANSPORT_CACHE
 from testsuite.mockserver import Mockserver
 from testsuite.oidc import OIDCProvider
 from testsuite.oidc.auth0 import Auth0Provider
@@ -23,6 +24,13 @@ from testsuite.prometheus import Prometheus
 from testsuite.oidc.keycloak import Keycloak
 from testsuite.tracing.jaeger import JaegerClient
 from testsuite.kubernetes.config_map import ConfigMap
+from testsuite.kubernetes import KubernetesObject
+from testsuite.kubernetes.api import API
+from testsuite.kubernetes.cleanup import LabelCleanup
+from testsuite.kubernetes.informer import INFORMER
+from testsuite.kubernetes.latency import RECONCILE_LATENCY, summarize, write_report
+from testsuite.kubernetes.watch import WATCHES
+from testsuite.lifecycle import TeardownScheduler
 from testsuite.tracing.tempo import RemoteTempoClient
 from testsuite.utils import randomize, _whoami
 
@@ -33,6 +41,11 @@ def pytest_addoption(parser):
         "--enforce", action="store_true", default=False, help="Fails tests instead of skip, if capabilities are missing"
     )
     parser.addoption("--standalone", action="store_true", default=False, help="Runs testsuite in standalone mode")
+    parser.addoption(
+        "--reconcile-latency-report",
+        metavar="PREFIX",
+        help="Writes reconcile latencies of all waited for objects to PREFIX.json and PREFIX.csv",
+    )
 
 
 def pytest_runtest_setup(item):
@@ -116,12 +129,93 @@ def _write_rerun_properties(item, report):
                 report.user_properties.append((f"__rp_rerun_{i}_output", output))
 
 
+# Retry accounting per test, collected from reports so that it works also with xdist workers
+_retry_stats_per_test: dict[str, dict] = {}
+_last_retry_stats = SESSION_RETRY_STATS.asdict()
+
+
+def _attach_retry_stats(report):
+    """Attach KuadrantClient retries made since the previous report to the report"""
+    global _last_retry_stats  # pylint: disable=global-statement
+    current = SESSION_RETRY_STATS.asdict()
+    if current["attempts"] != _last_retry_stats["attempts"]:
+        retries = Counter(current["retries"])
+        retries.subtract(_last_retry_stats["retries"])
+        report.retry_stats = {
+            "requests": current["requests"] - _last_retry_stats["requests"],
+            "attempts": current["attempts"] - _last_retry_stats["attempts"],
+            "retries": {cause: count for cause, count in retries.items() if count > 0},
+            "backoff_time": current["backoff_time"] - _last_retry_stats["backoff_time"],
+        }
+    _last_retry_stats = current
+
+
+# Reconcile latencies, collected from reports so that it works also with xdist workers
+_reconcile_latency: list[dict] = []
+
+
+def pytest_runtest_logreport(report):
+    """Aggregates retry accounting and reconcile latencies of all test phases"""
+    _reconcile_latency.extend(getattr(report, "reconcile_latency", []))
+    stats = getattr(report, "retry_stats", None)
+    if stats:
+        total = _retry_stats_per_test.setdefault(
+            report.nodeid, {"requests": 0, "attempts": 0, "retries": Counter(), "backoff_time": 0.0}
+        )
+        total["requests"] += stats["requests"]
+        total["attempts"] += stats["attempts"]
+        total["retries"].update(stats["retries"])
+        total["backoff_time"] += stats["backoff_time"]
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Shows KuadrantClient retries and reconcile latencies"""
+    _retry_summary(terminalreporter)
+    _reconcile_latency_summary(terminalreporter, config)
+
+
+def _retry_summary(terminalreporter):
+    """Shows tests which spent the most time sleeping in KuadrantClient retries"""
+    if not _retry_stats_per_test:
+        return
+    terminalreporter.section("KuadrantClient retries (top 20 by backoff time)")
+    stats = sorted(_retry_stats_per_test.items(), key=lambda i: i[1]["backoff_time"], reverse=True)
+    for nodeid, test_stats in stats[:20]:
+        terminalreporter.write_line(
+            f"{test_stats['backoff_time']:8.1f}s {test_stats['attempts']:6d} attempts / "
+            f"{test_stats['requests']:6d} requests {dict(test_stats['retries'])} {nodeid}"
+        )
+    terminalreporter.write_line(
+        f"Total: {sum(i['backoff_time'] for i in _retry_stats_per_test.values()):.1f}s of backoff, "
+        f"{sum(i['attempts'] - i['requests'] for i in _retry_stats_per_test.values())} retries"
+    )
+
+
+def _reconcile_latency_summary(terminalreporter, config):
+    """Shows reconcile latencies per kind and state, and writes them to the report if requested"""
+    if not _reconcile_latency:
+        return
+    terminalreporter.section("Reconcile latency (seconds from commit)")
+    terminalreporter.write_line(f"{'kind':<24} {'state':<18} {'count':>6} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}")
+    for row in summarize(_reconcile_latency):
+        terminalreporter.write_line(
+            f"{row['kind']:<24} {row['state']:<18} {row['count']:6d} {row['mean']:8.1f} {row['p50']:8.1f} "
+            f"{row['p95']:8.1f} {row['max']:8.1f}"
+        )
+    if prefix := config.getoption("--reconcile-latency-report"):
+        write_report(_reconcile_latency, prefix)
+        terminalreporter.write_line(f"Reconcile latencies written to {prefix}.json and {prefix}.csv")
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Add jira link to html report and record rerun count for JUnit XML."""
+    """Add jira link to html report, record rerun count for JUnit XML and attach retry accounting."""
     pytest_html = item.config.pluginmanager.getplugin("html")
     outcome = yield
     report = outcome.get_result()
+    _attach_retry_stats(report)
+    if records := RECONCILE_LATENCY.drain():
+        report.reconcile_latency = records
     extra = getattr(report, "extra", [])
     if report.when == "setup":
         for marker in item.iter_markers(name="issue"):
@@ -167,6 +261,37 @@ def term_handler():
     signal.signal(signal.SIGTERM, orig)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def shared_transports():
+    """Closes connection pools shared by KuadrantClients at the end of the session"""
+    yield
+    TRANSPORT_CACHE.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def watches(testconfig):
+    """
+    Enables watch-based waiting for Kubernetes objects and configures staleness of the read cache fed by the watches,
+    stops the watches at the end
+    """
+    WATCHES.enabled = testconfig["kubernetes"]["watch"]
+    INFORMER.max_age = testconfig["kubernetes"]["informer_max_age"]
+    yield
+    WATCHES.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def kubernetes_api(testconfig):
+    """
+    Selects how objects are managed on the clusters, oc binary or direct Kubernetes API calls,
+    and whether modifications are sent as patches
+    """
+    API.enabled = testconfig["kubernetes"]["transport"] == "api"
+    KubernetesObject.patch_modifications = testconfig["kubernetes"]["modify"] == "patch"
+    yield
+    API.close()
+
+
 def _detect_gateway_api_version():
     """Detect Gateway API CRD version from the cluster at collection time"""
     try:
@@ -365,15 +490,51 @@ def blame(request):
 
 
 @pytest.fixture(scope="session")
-def label(blame):
+def label_cleanup(testconfig):
+    """
+    Deletes everything labeled with the session and module labels from all namespaces at the end of the session,
+    if enabled by `kubernetes.cleanup`
+    """
+    cleanup = LabelCleanup()
+    for name in ("project", "project2", "system_project"):
+        cleanup.add_client(
+            testconfig["control_plane"]["cluster"].change_project(testconfig["service_protection"][name])
+        )
+    yield cleanup
+    if testconfig["kubernetes"]["cleanup"]:
+        cleanup.run()
+
+
+@pytest.fixture(scope="session")
+def label(blame, label_cleanup):
     """Session scope label for all resources"""
-    return blame("testrun")
+    label = blame("testrun")
+    label_cleanup.add_label(label)
+    return label
 
 
 @pytest.fixture(scope="module")
-def module_label(label):
+def module_label(label, label_cleanup):
     """Module scope label for all resources"""
-    return randomize(label)
+    module_label = randomize(label)
+    label_cleanup.add_label(module_label)
+    return module_label
+
+
+@pytest.fixture(scope="session")
+def session_teardown():
+    """Deletes session scope objects at the end of the session, concurrently in the order of their dependencies"""
+    scheduler = TeardownScheduler()
+    yield scheduler
+    scheduler.run()
+
+
+@pytest.fixture(scope="module")
+def module_teardown():
+    """Deletes module scope objects at the end of the module, concurrently in the order of their dependencies"""
+    scheduler = TeardownScheduler()
+    yield scheduler
+    scheduler.run()
 
 
 @pytest.fixture(scope="session")
@@ -27,7 +27,7 @@ def dns_server(testconfig, skip_or_fail):
 
 
 @pytest.fixture(scope="session")
-def cluster2(testconfig):
+def cluster2(testconfig, label_cleanup):
     """Kubernetes client for the primary namespace"""
     if not testconfig["control_plane"]["cluster2"]:
         pytest.skip("Second cluster is not configured properly")
@@ -36,6 +36,7 @@ def cluster2(testconfig):
     client = testconfig["control_plane"]["cluster2"].change_project(project)
     if not client.connected:
         pytest.fail(f"You are not logged into the second cluster or the {project} namespace doesn't exist")
+    label_cleanup.add_client(client)
     return client
 
 
@@ -1,6 +1,8 @@
 """Test for multicluster global rate limiting feature with a shared Redis backend."""
 
 import pytest
+
+from testsuite.httpx.async_client import AsyncKuadrantClient, run_batch
 from testsuite.kuadrant.limitador import Redis
 from testsuite.kuadrant.policy.rate_limit import Limit
 
@@ -56,3 +58,21 @@ def test_global_limit_is_shared(
     assert client2.get("/get").status_code == 429
     if bug_response == 200:
         raise Xfailexception()
+
+
+@pytest.mark.flaky(reruns=3, reruns_delay=35)
+def test_global_limit_concurrent(client1, client2, limit):
+    """
+    Tests that the shared counter holds when both clusters receive requests at the same time.
+    Both clusters get the whole limit concurrently, only the limit in total should be accepted.
+    """
+
+    async def _send(client):
+        async with AsyncKuadrantClient.from_client(client) as async_client:
+            return await async_client.get_many("/get", limit.limit, concurrency=limit.limit)
+
+    responses1, responses2 = run_batch(_send(client1), _send(client2))
+
+    status_codes = [response.status_code for response in responses1 + responses2]
+    assert status_codes.count(200) == limit.limit
+    assert status_codes.count(429) == limit.limit
@@ -14,7 +14,9 @@ from testsuite.kuadrant import KuadrantCR
 from testsuite.kuadrant.policy.authorization.auth_policy import AuthPolicy
 from testsuite.kuadrant.policy.rate_limit import RateLimitPolicy
 from testsuite.kubernetes.api_key import APIKey
+from testsuite.kubernetes import commit_all
 from testsuite.kubernetes.client import KubernetesClient
+from testsuite.lifecycle import ReadinessBarrier
 
 
 @pytest.fixture(scope="session")
@@ -61,13 +63,13 @@ def rate_limit(kuadrant, cluster, blame, request, module_label, route, gateway):
 
 
 @pytest.fixture(scope="module", autouse=True)
-def commit(request, authorization, rate_limit):
+def commit(module_teardown, authorization, rate_limit):
     """Commits all important stuff before tests"""
-    for component in [authorization, rate_limit]:
-        if component is not None:
-            request.addfinalizer(component.delete)
-            component.commit()
-            component.wait_for_ready()
+    components = [component for component in [authorization, rate_limit] if component is not None]
+    for component in components:
+        module_teardown.add(component)
+    commit_all(components)
+    ReadinessBarrier(components).wait()
 
 
 @pytest.fixture(scope="session")
@@ -87,17 +89,17 @@ def kuadrant(request, testconfig):
 
 
 @pytest.fixture(scope="session")
-def backend(request, cluster, blame, label, testconfig):
+def backend(session_teardown, cluster, blame, label, testconfig):
     """Deploys Httpbin backend"""
     image = testconfig["httpbin"]["image"]
     httpbin = Httpbin(cluster, blame("httpbin"), label, image)
-    request.addfinalizer(httpbin.delete)
+    session_teardown.add(httpbin)
     httpbin.commit()
     return httpbin
 
 
 @pytest.fixture(scope="session")
-def gateway(request, kuadrant, cluster, blame, label, testconfig, wildcard_domain) -> Gateway:
+def gateway(request, session_teardown, kuadrant, cluster, blame, label, testconfig, wildcard_domain) -> Gateway:
     """Deploys Gateway that wires up the Backend behind the reverse-proxy and Authorino instance"""
     if kuadrant:
         gw = KuadrantGateway.create_instance(cluster, blame("gw"), {"app": label})
@@ -111,7 +113,7 @@ def gateway(request, kuadrant, cluster, blame, label, testconfig, wildcard_domai
             testconfig["service_protection"]["envoy"]["image"],
             labels={"app": label},
         )
-    request.addfinalizer(gw.delete)
+    session_teardown.add(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -131,7 +133,7 @@ def hostname(gateway, exposer, domain_name) -> Hostname:
 
 
 @pytest.fixture(scope="module")
-def route(request, kuadrant, gateway, blame, hostname, backend, module_label) -> GatewayRoute:
+def route(module_teardown, kuadrant, gateway, blame, hostname, backend, module_label) -> GatewayRoute:
     """Route object"""
     if kuadrant:
         route = HTTPRoute.create_instance(gateway.cluster, blame("route"), gateway, {"app": module_label})
@@ -139,7 +141,7 @@ def route(request, kuadrant, gateway, blame, hostname, backend, module_label) ->
         route = EnvoyVirtualRoute.create_instance(gateway.cluster, blame("route"), gateway)
     route.add_hostname(hostname.hostname)
     route.add_backend(backend)
-    request.addfinalizer(route.delete)
+    module_teardown.add(route)
     route.commit()
     return route
 
@@ -153,7 +155,7 @@ def client(route, hostname):  # pylint: disable=unused-argument
 
 
 @pytest.fixture(scope="module")
-def create_api_key(blame, request, cluster):
+def create_api_key(blame, module_teardown, cluster):
     """Creates API key Secret"""
 
     def _create_secret(
@@ -161,7 +163,7 @@ def create_api_key(blame, request, cluster):
     ):
         secret_name = blame(name)
         secret = APIKey.create_instance(ocp, secret_name, label_selector, api_key, annotations)
-        request.addfinalizer(lambda: secret.delete(ignore_not_found=True))
+        module_teardown.add(secret, lambda: secret.delete(ignore_not_found=True))
         secret.commit()
         return secret
 
@@ -9,10 +9,12 @@ from testsuite.httpx.auth import HttpxOidcClientAuth
 from testsuite.kuadrant.policy.authorization.auth_policy import AuthPolicy
 from testsuite.kuadrant.policy.dns import DNSPolicy
 from testsuite.kuadrant.policy.tls import TLSPolicy
+from testsuite.kubernetes import commit_all
+from testsuite.lifecycle import ReadinessBarrier
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, wildcard_domain, module_label):
+def gateway(module_teardown, cluster, blame, wildcard_domain, module_label):
     """Returns ready gateway"""
     gateway_name = blame("gw")
     gw = KuadrantGateway.create_instance(
@@ -21,7 +23,7 @@ def gateway(request, cluster, blame, wildcard_domain, module_label):
         {"app": module_label},
     )
     gw.add_listener(TLSGatewayListener(hostname=wildcard_domain, gateway_name=gateway_name))
-    request.addfinalizer(gw.delete)
+    module_teardown.add(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -52,10 +54,10 @@ def rate_limit():
 
 
 @pytest.fixture(scope="module")
-def exposer(request, cluster) -> Exposer:
+def exposer(module_teardown, cluster) -> Exposer:
     """DNSPolicyExposer setup with expected TLS certificate"""
     exposer = DNSPolicyExposer(cluster)
-    request.addfinalizer(exposer.delete)
+    module_teardown.add(exposer)
     exposer.commit()
     return exposer
 
@@ -83,13 +85,15 @@ def tls_policy(blame, gateway, module_label, cluster_issuer):
 
 
 @pytest.fixture(scope="module", autouse=True)
-def commit(request, authorization, rate_limit, dns_policy, tls_policy):
+def commit(module_teardown, authorization, rate_limit, dns_policy, tls_policy):
     """Commits all important stuff before tests"""
-    for component in [dns_policy, tls_policy, authorization, rate_limit]:
-        if component is not None:
-            request.addfinalizer(component.delete)
-            component.commit()
-            component.wait_for_ready()
+    components = [
+        component for component in [dns_policy, tls_policy, authorization, rate_limit] if component is not None
+    ]
+    for component in components:
+        module_teardown.add(component)
+    commit_all(components)
+    ReadinessBarrier(components).wait()
 
 
 @pytest.fixture(scope="module")
@@ -4,6 +4,8 @@ import pytest
 from testsuite.custom_metrics_apiserver.client import CustomMetricsApiServerClient
 from testsuite.kuadrant.policy import CelPredicate
 from testsuite.kuadrant.policy.rate_limit import RateLimitPolicy, Limit
+from testsuite.kubernetes import commit_all
+from testsuite.lifecycle import ReadinessBarrier
 
 LIMIT = Limit(3, "5s")
 
@@ -37,9 +39,10 @@ def rate_limit(blame, gateway, module_label, cluster):
 
 
 @pytest.fixture(scope="module", autouse=True)
-def commit(request, authorization, rate_limit, dns_policy, tls_policy):
+def commit(module_teardown, authorization, rate_limit, dns_policy, tls_policy):
     """Commits all important stuff before tests"""
-    for component in [dns_policy, tls_policy, authorization, rate_limit]:
-        request.addfinalizer(component.delete)
-        component.commit()
-        component.wait_for_ready()
+    components = [dns_policy, tls_policy, authorization, rate_limit]
+    for component in components:
+        module_teardown.add(component)
+    commit_all(components)
+    ReadinessBarrier(components).wait()
@@ -0,0 +1,28 @@
+"""
+Tests that a sub-second limit is enforced for a concurrent burst of requests
+"""
+
+import pytest
+
+from testsuite.kuadrant.policy.rate_limit import Limit
+
+pytestmark = [pytest.mark.limitador]
+
+LIMIT = Limit(10, "2s")
+
+
+@pytest.fixture(scope="module")
+def rate_limit(rate_limit):
+    """Add limit to the policy"""
+    rate_limit.add_limit("burst", [LIMIT])
+    return rate_limit
+
+
+@pytest.mark.flaky(reruns=3, reruns_delay=5)
+def test_burst_limit(client):
+    """Tests that a concurrent burst is limited to exactly the allowed amount of requests"""
+    responses = client.get_many("/get", 2 * LIMIT.limit, concurrency=10)
+
+    status_codes = [response.status_code for response in responses]
+    assert status_codes.count(200) == LIMIT.limit
+    assert status_codes.count(429) == LIMIT.limit
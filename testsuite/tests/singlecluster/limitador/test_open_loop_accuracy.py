@@ -0,0 +1,31 @@
+"""
+Tests that a limit is enforced accurately under sustained load sent at a constant arrival rate
+"""
+
+import pytest
+
+from testsuite.httpx.open_loop import OpenLoopGenerator
+from testsuite.kuadrant.policy.rate_limit import Limit
+
+pytestmark = [pytest.mark.limitador]
+
+LIMIT = Limit(100, "1s")
+DURATION = 10
+
+
+@pytest.fixture(scope="module")
+def rate_limit(rate_limit):
+    """Add limit to the policy"""
+    rate_limit.add_limit("accuracy", [LIMIT])
+    return rate_limit
+
+
+@pytest.mark.parametrize("poisson", [False, True], ids=["constant", "poisson"])
+@pytest.mark.flaky(reruns=3, reruns_delay=5)
+def test_limit_accuracy(client, poisson):
+    """Tests that Limitador accepts the allowed amount of requests per window when the load exceeds the limit"""
+    generator = OpenLoopGenerator(client, rate=1.5 * LIMIT.limit, duration=DURATION, poisson=poisson)
+    result = generator.run("GET", "/get")
+
+    result.assert_no_failures()
+    result.assert_limit(LIMIT.limit, window=1, tolerance=0.1)
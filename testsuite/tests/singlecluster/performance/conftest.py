@@ -0,0 +1,30 @@
+"""Conftest for performance tests, which send their traffic through an AuthPolicy protected route"""
+
+import pytest
+
+from testsuite.httpx.auth import HeaderApiKeyAuth
+
+
+@pytest.fixture(scope="module")
+def api_key(create_api_key, module_label):
+    """Creates API key Secret"""
+    return create_api_key("api-key", module_label, "api_key_value")
+
+
+@pytest.fixture(scope="module")
+def auth(api_key):
+    """Valid API Key Auth"""
+    return HeaderApiKeyAuth(api_key)
+
+
+@pytest.fixture(scope="module")
+def authorization(authorization, api_key):
+    """Protects the route with API key identity"""
+    authorization.identity.add_api_key("api_key", selector=api_key.selector)
+    return authorization
+
+
+@pytest.fixture(scope="module")
+def rate_limit():
+    """Only AuthPolicy is needed"""
+    return None
@@ -0,0 +1,49 @@
+"""
+Compares throughput of HTTP/1.1 connections and HTTP/2 streams multiplexed over a single connection
+through an AuthPolicy protected route
+"""
+
+import logging
+import time
+
+import pytest
+
+from testsuite.httpx import ResultSummary
+
+pytestmark = [pytest.mark.performance, pytest.mark.authorino, pytest.mark.kuadrant_only]
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = 1000
+CONCURRENCY = 50
+
+
+def measure(hostname, auth, http_version, **client_args) -> tuple[float, ResultSummary]:
+    """Returns requests per second through the gateway with concurrent requests over the HTTP version"""
+    with hostname.client(**client_args) as client:
+        warmup = client.get("/get", auth=auth)
+        assert warmup.status_code == 200
+        assert warmup.http_version == http_version
+
+        start = time.perf_counter()
+        responses = client.get_many("/get", REQUESTS, auth=auth, concurrency=CONCURRENCY, results=ResultSummary())
+        duration = time.perf_counter() - start
+
+    responses.assert_all(status_code=200)
+    throughput = REQUESTS / duration
+    logger.info("%s: %.1f requests/s, %s", http_version, throughput, responses.latency())
+    return throughput, responses
+
+
+def test_throughput(hostname, route, auth, record_property):  # pylint: disable=unused-argument
+    """Measures throughput of HTTP/2 streams against the HTTP/1.1 baseline and records both and their ratio"""
+    http1, http1_responses = measure(hostname, auth, "HTTP/1.1")
+    # Prior knowledge works for both plain-text (h2c) and TLS hostnames
+    http2, http2_responses = measure(hostname, auth, "HTTP/2", http1=False, http2=True)
+
+    ratio = http2 / http1
+    logger.info("HTTP/2 throughput is %.2fx of HTTP/1.1", ratio)
+    for prefix, throughput, responses in (("http1", http1, http1_responses), ("http2", http2, http2_responses)):
+        record_property(f"{prefix}_throughput", f"{throughput:.1f}")
+        record_property(f"{prefix}_latency_p99", f"{responses.latency().p99:.4f}")
+    record_property("http2_to_http1_ratio", f"{ratio:.2f}")
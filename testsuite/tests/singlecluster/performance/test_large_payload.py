@@ -0,0 +1,39 @@
+"""
+Sends large request bodies through an AuthPolicy protected route and reads the responses as streams,
+so that neither of the payloads is buffered in the testsuite memory
+"""
+
+import pytest
+
+from testsuite.httpx.streaming import RepeatedContent
+from testsuite.utils import MESSAGE_1KB
+
+pytestmark = [pytest.mark.performance, pytest.mark.authorino, pytest.mark.kuadrant_only]
+
+PAYLOAD_SIZE = 10 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def payload():
+    """10MB request body generated from the 1KB message"""
+    return RepeatedContent(MESSAGE_1KB.read_bytes(), PAYLOAD_SIZE)
+
+
+def test_large_request_body(client, auth, payload):
+    """Tests that large request body passes through the gateway and is echoed back by the backend"""
+    response = client.stream_request("POST", "/anything", content=payload, headers=payload.headers, auth=auth)
+    assert response.status_code == 200
+    assert response.body.length >= PAYLOAD_SIZE, f"Echoed body is smaller than the sent one: {response.body}"
+
+
+def test_large_request_body_unauthorized(client, payload):
+    """Tests that large request body without credentials is rejected"""
+    response = client.stream_request("POST", "/anything", content=payload, headers=payload.headers)
+    assert response.status_code == 401
+
+
+def test_streamed_response_size(client, auth):
+    """Tests that response body read incrementally has the requested size"""
+    response = client.stream_request("GET", "/bytes/102400", auth=auth)
+    assert response.status_code == 200
+    assert response.body.length == 102400
@@ -0,0 +1,33 @@
+"""Conftest for scale tests, which create their own topology of Gateways, HTTPRoutes and policies"""
+
+import pytest
+
+from testsuite.kuadrant.scale import ScaleGenerator, Topology
+
+
+@pytest.fixture(scope="module")
+def authorization():
+    """Scale tests don't use the default AuthPolicy"""
+    return None
+
+
+@pytest.fixture(scope="module")
+def rate_limit():
+    """Scale tests don't use the default RateLimitPolicy"""
+    return None
+
+
+@pytest.fixture(scope="module")
+def topology(testconfig):
+    """Topology configured in the `scale` settings"""
+    return Topology(gateways=testconfig["scale"]["gateways"], listeners=testconfig["scale"]["listeners"])
+
+
+@pytest.fixture(scope="module")
+def scale_generator(cluster, blame, backend, base_domain, module_label, testconfig):
+    """Creates topologies of objects labeled with the module label and deletes them at the end of the module"""
+    generator = ScaleGenerator(
+        cluster, blame("scale"), backend, base_domain, module_label, testconfig["scale"]["max_workers"]
+    )
+    yield generator
+    assert generator.teardown() == 0, "Some objects of the scale topology were not deleted, see the log"
@@ -0,0 +1,37 @@
+"""
+Measures how many RateLimitPolicies per second Kuadrant enforces when a batch of them is created, updated
+(`add_limit`) or deleted at once, for increasing batch sizes configured in `benchmark` settings.
+Results are written to `benchmark.report` and compared against `benchmark.baseline`, if it is set.
+"""
+
+import pytest
+
+from testsuite.kuadrant.benchmark import PolicyThroughput, load_report, regressions, write_report
+from testsuite.kuadrant.scale import Topology
+
+pytestmark = [pytest.mark.scale, pytest.mark.kuadrant_only]
+
+
+@pytest.fixture(scope="module")
+def batch_sizes(testconfig):
+    """Increasing batch sizes"""
+    return sorted(testconfig["benchmark"]["batch_sizes"])
+
+
+@pytest.fixture(scope="module")
+def routes(scale_generator, batch_sizes):
+    """HTTPRoutes of a single Gateway, each policy of a batch targets a different one"""
+    scale_generator.create(Topology(gateways=1, listeners=batch_sizes[-1], route_policies=()))
+    return scale_generator.routes
+
+
+def test_policy_throughput(scale_generator, routes, batch_sizes, testconfig):
+    """Tests that throughput of policy reconciliation didn't regress against the baseline"""
+    throughput = PolicyThroughput(scale_generator)
+    for batch in batch_sizes:
+        throughput.run(routes[:batch])
+
+    write_report(throughput.results, testconfig["benchmark"]["report"])
+    if baseline := testconfig["benchmark"]["baseline"]:
+        found = regressions(throughput.results, load_report(baseline), testconfig["benchmark"]["regression_threshold"])
+        assert not found, f"Policy reconciliation throughput regressed: {found}"
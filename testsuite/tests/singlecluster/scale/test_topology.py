@@ -0,0 +1,17 @@
+"""
+Creates N Gateways with M listeners each, an HTTPRoute for every listener, every HTTPRoute with an AuthPolicy
+and a RateLimitPolicy, and checks that everything gets enforced. Time-to-ready of every object is reported
+as its reconcile latency (`make scale latency=1`).
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.scale, pytest.mark.kuadrant_only]
+
+
+def test_topology_enforced(scale_generator, topology):
+    """Tests that all objects of the topology get Programmed, Ready or Enforced"""
+    timings = scale_generator.create(topology)
+
+    assert len(timings) == topology.size
+    assert all(seconds is not None for seconds in timings.values())
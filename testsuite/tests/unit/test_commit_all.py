@@ -0,0 +1,48 @@
+"""Tests for commit_all grouping of objects, with oc calls replaced by mocks, so they don't need any cluster"""
+
+from unittest import mock
+
+import openshift_client as oc
+import pytest
+from openshift_client.context import context
+
+from testsuite.kubernetes import KubernetesObject, commit_all
+
+
+def _object(kind: str, name: str, namespace: str = None) -> KubernetesObject:
+    metadata = {"name": name}
+    if namespace is not None:
+        metadata["namespace"] = namespace
+    return KubernetesObject({"apiVersion": "v1", "kind": kind, "metadata": metadata}, context=oc.Context())
+
+
+@pytest.fixture
+def fake_oc():
+    """Records namespaces of the refreshes, returns applied objects with a resourceVersion"""
+    namespaces = []
+
+    def _selector(qnames):
+        namespaces.append(next((c.project_name for c in reversed(context.stack) if c.project_name), None))
+        objects = []
+        for qname in qnames:
+            kind, name = qname.split("/")
+            model = {"apiVersion": "v1", "kind": kind, "metadata": {"name": name, "resourceVersion": "1"}}
+            objects.append(oc.APIObject(model))
+        return mock.Mock(objects=mock.Mock(return_value=objects))
+
+    with mock.patch.object(oc, "invoke") as invoke, mock.patch.object(oc, "selector", _selector):
+        yield invoke, namespaces
+
+
+def test_mixed_scopes(fake_oc):
+    """Tests that namespaced and cluster-scoped objects in a context without a project are committed together"""
+    invoke, namespaces = fake_oc
+    objects = [_object("ConfigMap", "config", "ns1"), _object("Namespace", "ns2"), _object("Secret", "secret", "ns1")]
+    committed = commit_all(objects)
+
+    assert committed == objects
+    # Namespaced objects share a single apply, the cluster-scoped one is applied without a namespace
+    assert invoke.call_count == 2
+    assert sorted(namespaces, key=str) == sorted(["ns1", None], key=str)
+    assert all(obj.committed for obj in objects)
+    assert all(obj.model.metadata.resourceVersion == "1" for obj in objects)
@@ -0,0 +1,51 @@
+"""Tests for matching of Limitador limits to the RateLimitPolicies they were generated from, without any cluster"""
+
+import pytest
+
+from testsuite.kuadrant.policy.rate_limit import RateLimitPolicy
+from testsuite.kuadrant.policy.token_rate_limit import TokenRateLimitPolicy
+
+
+def _limitador_limit(name: str, max_value: int, seconds: int, namespace: str = "project/route") -> dict:
+    """Limit as it is in the Limitador CR spec and in the /limits response of Limitador"""
+    return {
+        "conditions": [f'descriptors[0]["limit.{name}__3a5e4c3b"] == "1"'],
+        "max_value": max_value,
+        "name": None,
+        "namespace": namespace,
+        "seconds": seconds,
+        "variables": [],
+    }
+
+
+@pytest.fixture(params=[RateLimitPolicy, TokenRateLimitPolicy])
+def policy(request):
+    """Policy targeting the HTTPRoute with a limit in the spec and another one in the overrides"""
+    return request.param(
+        {
+            "apiVersion": "kuadrant.io/v1",
+            "kind": request.param.__name__,
+            "metadata": {"name": "policy", "namespace": "project"},
+            "spec": {
+                "targetRef": {"group": "gateway.networking.k8s.io", "kind": "HTTPRoute", "name": "route"},
+                "limits": {"basic": {"rates": [{"limit": 5, "window": "10s"}]}},
+                "overrides": {"limits": {"my-limit": {"rates": [{"limit": 3, "window": "1m"}]}}},
+            },
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "limit, generated",
+    [
+        pytest.param(_limitador_limit("basic", 5, 10), True, id="spec"),
+        pytest.param(_limitador_limit("my_limit", 3, 60), True, id="overrides"),
+        pytest.param(_limitador_limit("basic", 5, 10, "project/other"), False, id="other-route"),
+        pytest.param(_limitador_limit("basic", 5, 60), False, id="other-window"),
+        pytest.param(_limitador_limit("basic", 6, 10), False, id="other-limit"),
+        pytest.param(_limitador_limit("basic2", 5, 10), False, id="other-name"),
+    ],
+)
+def test_generated(policy, limit, generated):
+    """Tests that only limits with the name, rate and namespace of the policy are matched to it"""
+    assert policy.generated(limit) is generated
@@ -0,0 +1,93 @@
+"""Tests for ResultSummary aggregation of results, which don't need any cluster"""
+
+import httpx
+import pytest
+
+from testsuite.httpx import KuadrantClient, RequestTimings, Result, ResultSummary
+
+
+def _client(status_code: int) -> KuadrantClient:
+    """Client whose every response has the status code and a body streamed from an iterator"""
+
+    def _handler(_):
+        return httpx.Response(status_code, content=iter([b"error ", b"body"]))
+
+    return KuadrantClient(base_url="http://backend", transport=httpx.MockTransport(_handler), retry_codes=[])
+
+
+def test_streamed_server_error():
+    """Tests that streamed 5xx responses are summarised by their body length and digest, without reading them"""
+    with _client(500) as client:
+        summary = client.request_many("GET", "/", 2, results=ResultSummary(), streaming=True)
+
+    assert summary.status_codes == {500: 2}
+    assert len(summary.failures) == 2
+    assert "length=10" in summary.failures[0]
+
+
+def test_server_error():
+    """Tests that 5xx responses are summarised by the beginning of their body"""
+    with _client(500) as client:
+        summary = client.request_many("GET", "/", 2, results=ResultSummary())
+
+    assert summary.status_codes == {500: 2}
+    assert summary.failures[0].endswith("error body")
+
+
+def _result(status_code: int = None, error: Exception = None, total: float = None) -> Result:
+    """Result of a request which got the status code or failed with the error, taking `total` seconds"""
+    response = httpx.Response(status_code, text="error body") if status_code is not None else None
+    return Result([], response=response, error=error, timings=RequestTimings(total=total))
+
+
+def test_empty():
+    """Tests that empty summary passes all assertions and reports zero latencies"""
+    summary = ResultSummary()
+
+    assert len(summary) == 0
+    assert summary.latency().count == 0
+    assert summary.latency().p99 == 0
+    summary.assert_all(200)
+    summary.assert_no_errors()
+    assert "total=0" in str(summary)
+
+
+def test_single_sample():
+    """Tests that all percentiles of a single sample are the sample itself"""
+    summary = ResultSummary()
+    summary.append(_result(200, total=0.25))
+
+    latency = summary.latency()
+    assert latency.count == 1
+    assert latency.p50 == latency.p99 == latency.p999 == 0.25
+    summary.assert_latency(99, 0.25)
+    summary.assert_all(200)
+
+
+def test_mixed_statuses():
+    """Tests that statuses and errors are counted separately and the first mismatch is reported"""
+    summary = ResultSummary()
+    summary.extend(
+        [
+            _result(200, total=0.1),
+            _result(429, total=0.2),
+            _result(503, total=0.3),
+            _result(error=httpx.ConnectTimeout("timed out")),
+            _result(error=httpx.ConnectError("Name or service not known")),
+            _result(200, total=0.4),
+        ]
+    )
+
+    assert len(summary) == 6
+    assert summary.status_codes == {200: 2, 429: 1, 503: 1}
+    assert summary.errors == {"timeout": 1, "dns": 1}
+    # Only responses have latencies
+    assert summary.latency().count == 4
+    assert summary.latency().max == 0.4
+    # 5xx responses and errors are kept as failures, 4xx responses are not
+    assert [failure.split(":")[0] for failure in summary.failures] == ["#3", "#4", "#5"]
+    summary.assert_count(200, 2)
+    with pytest.raises(AssertionError, match="request 2 out of 6 requests: 429 != 200"):
+        summary.assert_all(200)
+    with pytest.raises(AssertionError, match="2 requests failed"):
+        summary.assert_no_errors()
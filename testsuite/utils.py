@@ -10,9 +10,11 @@ from time import sleep
 from collections.abc import Collection
 from copy import deepcopy
 from dataclasses import is_dataclass, fields
+from functools import cache, lru_cache
 from importlib import resources
 from io import StringIO
-from typing import Dict, Union
+from operator import attrgetter
+from typing import Any, Callable, Dict, Union
 from urllib.parse import urlparse, ParseResult
 
 import dns.resolver
@@ -135,36 +137,98 @@ def asdict(obj) -> dict[str, JSONValues]:
     This function converts dataclass object to dictionary.
     While it works similar to `dataclasses.asdict` a notable change is usage of
     overriding `asdict()` function if dataclass contains it.
-    This function works recursively in lists, tuples and dicts. All other values are passed to copy.deepcopy function.
+    This function works recursively in lists, tuples and dicts. All other values are passed to copy.deepcopy function,
+    except immutable ones, which are shared. Output of hashable frozen dataclasses is cached.
     """
     if not is_dataclass(obj):
         raise TypeError("asdict() should be called on dataclass instances")
     return _asdict_recurse(obj)
 
 
+# Leaf types which deepcopy would return as they are
+_IMMUTABLE = frozenset({str, int, float, bool, bytes, complex, type(None)})
+
+
+@cache
+def _plan(cls) -> tuple[tuple[str, ...], Callable[[Any], tuple], bool]:
+    """Returns field names, getter of all their values at once and whether the dataclass output can be cached"""
+    names = tuple(field.name for field in fields(cls))
+    getter: Callable[[Any], tuple]
+    if len(names) > 1:
+        getter = attrgetter(*names)
+    else:
+
+        def getter(obj):
+            return tuple(getattr(obj, name) for name in names)
+
+    params = cls.__dataclass_params__
+    return names, getter, params.frozen and params.eq
+
+
 def _asdict_recurse(obj):
     if hasattr(obj, "asdict"):
         return obj.asdict()
 
     if not is_dataclass(obj):
-        return deepcopy(obj)
+        return obj if type(obj) in _IMMUTABLE else deepcopy(obj)
+
+    if _plan(type(obj))[2]:
+        try:
+            return _copy_containers(_asdict_cached(_typed(obj), obj))
+        except TypeError:
+            pass  # unhashable frozen dataclass, e.g. with a list field
+    return _asdict_fields(obj)
+
+
+@lru_cache(maxsize=4096)
+def _asdict_cached(key, obj):  # pylint: disable=unused-argument
+    """
+    Frozen dataclasses can't change, so their output is computed only once, callers get its copy.
+    Equal dataclasses with values of different types (e.g. 1, 1.0 and True) are told apart by the typed key.
+    """
+    return _asdict_fields(obj)
+
+
+def _typed(value):
+    """Returns the value paired with its type, recursively for dataclass fields, lists and tuples"""
+    cls = type(value)
+    if is_dataclass(value):
+        return cls, tuple(_typed(i) for i in _plan(cls)[1](value))
+    if isinstance(value, (list, tuple)):
+        return cls, tuple(_typed(i) for i in value)
+    return cls, value
+
+
+def _copy_containers(value):
+    """Copies dicts and lists of the value, immutable leaves are shared"""
+    if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+        return {k: v if type(v) in _IMMUTABLE else _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, dict):
+        return type(value)((k, _copy_containers(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value)(_copy_containers(i) for i in value)
+    return value
+
 
+def _asdict_fields(obj):
+    names, getter, _ = _plan(type(obj))
     result = {}
-    for field in fields(obj):
-        value = getattr(obj, field.name)
+    for name, value in zip(names, getter(obj)):
         if value is None:
             continue  # do not include None values
 
-        if is_dataclass(value):
-            result[field.name] = _asdict_recurse(value)
+        if type(value) in _IMMUTABLE:
+            result[name] = value
+        elif is_dataclass(value):
+            result[name] = _asdict_recurse(value)
         elif isinstance(value, (list, tuple)):
-            result[field.name] = type(value)(_asdict_recurse(i) for i in value)
+            result[name] = type(value)(_asdict_recurse(i) for i in value)
         elif isinstance(value, dict):
-            result[field.name] = type(value)((_asdict_recurse(k), _asdict_recurse(v)) for k, v in value.items())
+            result[name] = type(value)((_asdict_recurse(k), _asdict_recurse(v)) for k, v in value.items())
         elif isinstance(value, enum.Enum):
-            result[field.name] = value.value
+            result[name] = value.value
         else:
-            result[field.name] = deepcopy(value)
+            result[name] = deepcopy(value)
     return result
 
 